@@ -0,0 +1,28 @@
+"""Chunk embedding cache keyed by content hash.
+
+Revision ID: 002_chunk_embeddings
+Revises: 001_initial
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "002_chunk_embeddings"
+down_revision = "001_initial"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "chunk_embeddings",
+        sa.Column("content_sha256", sa.LargeBinary(32), primary_key=True),
+        sa.Column("model", sa.String(255), primary_key=True),
+        sa.Column("vector", sa.LargeBinary(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("chunk_embeddings")
@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+import re
 import uuid
 from typing import Any
 
+try:
+    import numpy as np
+except ImportError:
+    # Trimmed serverless deployment ships without numpy
+    np = None
+
 from app.core.config import get_settings
 from app.core.logging import get_logger
 from app.agents.state import AgentState
@@ -21,6 +28,9 @@ User question: {query}
 
 Return ONLY the queries, one per line. No numbering, no explanations."""
 
+# Definition-style lookups favour exact keyword matches; one compiled scan per query
+_SPARSE_KEYWORDS_RE = re.compile(r"definition|what is|meaning of", re.IGNORECASE)
+
 
 class RetrievalAgent:
     """Optimizes search queries, selects retrieval strategy, and fetches relevant chunks."""
@@ -115,16 +125,32 @@ class RetrievalAgent:
         has_quotes = '"' in query
         if has_quotes or len(words) <= 3:
             return "hybrid"
-        if any(w in query.lower() for w in ["definition", "what is", "meaning of"]):
+        if _SPARSE_KEYWORDS_RE.search(query):
             return "sparse"
         return "hybrid"
 
     @staticmethod
     def _rank_fusion(chunks: list[dict], k: int = 60) -> list[dict]:
-        for chunk in chunks:
-            dense = chunk.get("dense_score", 0)
-            sparse = chunk.get("sparse_score", 0)
-            chunk["combined_score"] = dense * 0.6 + min(sparse / 20.0, 1.0) * 0.4
-
-        chunks.sort(key=lambda x: x.get("combined_score", 0), reverse=True)
+        if not chunks:
+            return chunks
+
+        if np is None:
+            for chunk in chunks:
+                dense = chunk.get("dense_score", 0)
+                sparse = chunk.get("sparse_score", 0)
+                chunk["combined_score"] = dense * 0.6 + min(sparse / 20.0, 1.0) * 0.4
+            chunks.sort(key=lambda x: x.get("combined_score", 0), reverse=True)
+            return chunks
+
+        # Score all chunks in two vector ops; float64 keeps results identical to the loop
+        n = len(chunks)
+        dense = np.fromiter((c.get("dense_score", 0) for c in chunks), dtype=np.float64, count=n)
+        sparse = np.fromiter((c.get("sparse_score", 0) for c in chunks), dtype=np.float64, count=n)
+        combined = dense * 0.6 + np.minimum(sparse / 20.0, 1.0) * 0.4
+
+        for chunk, score in zip(chunks, combined.tolist()):
+            chunk["combined_score"] = score
+        # Stable sort preserves the original order of ties, matching list.sort
+        order = np.argsort(-combined, kind="stable")
+        chunks[:] = [chunks[i] for i in order.tolist()]
         return chunks
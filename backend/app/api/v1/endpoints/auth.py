@@ -9,7 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import get_db
 from app.models.user import User
-from app.core.security import hash_password, verify_password, create_access_token, decode_access_token
+from app.core.security import ahash_password, averify_password, create_access_token, decode_access_token
 from app.schemas.auth import RegisterRequest, LoginRequest, TokenResponse, UserResponse
 
 router = APIRouter(prefix="/auth", tags=["auth"])
@@ -57,7 +57,7 @@ async def register(request: RegisterRequest, db: AsyncSession = Depends(get_db))
 
     user = User(
         email=request.email,
-        hashed_password=hash_password(request.password),
+        hashed_password=await ahash_password(request.password),
         full_name=request.full_name,
     )
     db.add(user)
@@ -73,7 +73,7 @@ async def login(request: LoginRequest, db: AsyncSession = Depends(get_db)):
     stmt = select(User).where(User.email == request.email)
     user = (await db.execute(stmt)).scalar_one_or_none()
 
-    if not user or not verify_password(request.password, user.hashed_password):
+    if not user or not await averify_password(request.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password",
@@ -1,5 +1,4 @@
 import uuid
-import json
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import StreamingResponse
@@ -14,6 +13,7 @@ from app.api.deps import (
     get_vector_store,
     get_orchestrator,
 )
+from app.core.responses import ORJSONResponse, dumps_json
 from app.models.session import ChatSession, ChatMessage, MessageRole
 from app.schemas.chat import (
     ChatRequest,
@@ -31,7 +31,7 @@ from app.agents.orchestrator import OrchestratorAgent
 router = APIRouter(tags=["chat"])
 
 
-@router.post("/chat")
+@router.post("/chat", response_class=ORJSONResponse)
 async def chat(
     request: ChatRequest,
     use_agents: bool = Query(default=False, description="Use multi-agent pipeline"),
@@ -159,10 +159,10 @@ async def _stream_response(
     ):
         if chunk["type"] == "text":
             full_content += chunk["content"]
-            yield f"data: {json.dumps({'type': 'text', 'content': chunk['content']})}\n\n"
+            yield f"data: {dumps_json({'type': 'text', 'content': chunk['content']})}\n\n"
         elif chunk["type"] == "sources":
             sources = chunk["sources"]
-            yield f"data: {json.dumps({'type': 'sources', 'sources': sources})}\n\n"
+            yield f"data: {dumps_json({'type': 'sources', 'sources': sources})}\n\n"
         elif chunk["type"] == "done":
             # Use a fresh session to persist the assistant message
             async with async_session_factory() as db:
@@ -174,7 +174,7 @@ async def _stream_response(
                 )
                 db.add(assistant_msg)
                 await db.commit()
-                yield f"data: {json.dumps({'type': 'done', 'message_id': str(assistant_msg.id)})}\n\n"
+                yield f"data: {dumps_json({'type': 'done', 'message_id': str(assistant_msg.id)})}\n\n"
 
 
 @router.get("/sessions", response_model=ChatSessionListResponse)
@@ -5,12 +5,13 @@ from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
 from starlette.responses import Response
 
 from app.core.config import get_settings
+from app.core.responses import ORJSONResponse
 
 router = APIRouter(tags=["system"])
 settings = get_settings()
 
 
-@router.get("/health")
+@router.get("/health", response_class=ORJSONResponse)
 async def health_check():
     """Application health check endpoint."""
     return {
@@ -10,12 +10,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.api.deps import get_current_user_id, get_db
+from app.core.responses import ORJSONResponse
 from app.models.session import ChatSession, ChatMessage
 
 router = APIRouter(prefix="/sessions", tags=["sessions"])
 
 
-@router.post("/{session_id}/share")
+@router.post("/{session_id}/share", response_class=ORJSONResponse)
 async def share_session(
     session_id: uuid.UUID,
     owner_id: uuid.UUID = Depends(get_current_user_id),
@@ -42,7 +43,7 @@ async def share_session(
     }
 
 
-@router.get("/shared/{share_token}")
+@router.get("/shared/{share_token}", response_class=ORJSONResponse)
 async def get_shared_session(
     share_token: str,
     db: AsyncSession = Depends(get_db),
@@ -73,7 +74,7 @@ async def get_shared_session(
     }
 
 
-@router.post("/{session_id}/unshare")
+@router.post("/{session_id}/unshare", response_class=ORJSONResponse)
 async def unshare_session(
     session_id: uuid.UUID,
     owner_id: uuid.UUID = Depends(get_current_user_id),
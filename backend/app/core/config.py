@@ -16,6 +16,8 @@ class Settings(BaseSettings):
     # Security
     secret_key: str = Field(default="change-me-in-production", alias="SECRET_KEY")
     access_token_expire_minutes: int = 60
+    # Pinned rather than left to the library default; each +1 doubles verify time
+    bcrypt_rounds: int = Field(default=12, ge=10, le=16, alias="BCRYPT_ROUNDS")
 
     # Database
     database_url: str = Field(
@@ -33,6 +35,16 @@ class Settings(BaseSettings):
     # Claude / Anthropic
     anthropic_api_key: str = Field(default="", alias="ANTHROPIC_API_KEY")
     claude_model: str = "claude-sonnet-4-20250514"
+    # Send system prompt + excerpts as a cached prefix (prompt caching); off keeps the
+    # excerpts in the user turn. On, excerpts are numbered in document order, so
+    # [Source N] labels no longer follow the (still relevance-ordered) sources list
+    anthropic_prompt_cache: bool = Field(default=False, alias="ANTHROPIC_PROMPT_CACHE")
+    # In-process answer cache; 0 for either disables it (the default). Each process keeps
+    # its own entries and only invalidates what it ingested or deleted itself, so with
+    # several workers or serverless instances a deleted document can still be cited by
+    # other instances until their entries expire
+    rag_cache_ttl_seconds: int = 0
+    rag_cache_max_entries: int = 1024
 
     # Pinecone
     pinecone_api_key: str = Field(default="", alias="PINECONE_API_KEY")
@@ -40,6 +52,12 @@ class Settings(BaseSettings):
         default="intellidoc-index", alias="PINECONE_INDEX_NAME"
     )
     pinecone_environment: str = Field(default="us-east-1", alias="PINECONE_ENVIRONMENT")
+    # Native dense+sparse queries need a dotproduct index; off keeps in-process BM25 + RRF
+    pinecone_hybrid: bool = Field(default=False, alias="PINECONE_HYBRID")
+    hybrid_alpha: float = 0.5  # dense weight; sparse gets 1 - alpha
+    # Upload dense vectors as per-vector int8 (cosine indexes only). Smaller upserts, but
+    # lossy and permanent: rounding can reorder near-tied chunks and lower recall
+    pinecone_int8_vectors: bool = Field(default=False, alias="PINECONE_INT8_VECTORS")
 
     # AWS S3
     aws_access_key_id: str = Field(default="", alias="AWS_ACCESS_KEY_ID")
@@ -4,10 +4,26 @@ import sys
 
 from app.core.config import get_settings
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def setup_logging() -> None:
     settings = get_settings()
 
+    if settings.debug:
+        renderer = structlog.dev.ConsoleRenderer()
+        logger_factory = structlog.PrintLoggerFactory()
+    elif orjson is not None:
+        # orjson renders straight to bytes, so write them without a str round-trip
+        renderer = structlog.processors.JSONRenderer(serializer=orjson.dumps)
+        logger_factory = structlog.BytesLoggerFactory()
+    else:
+        renderer = structlog.processors.JSONRenderer()
+        logger_factory = structlog.PrintLoggerFactory()
+
     structlog.configure(
         processors=[
             structlog.contextvars.merge_contextvars,
@@ -15,17 +31,13 @@ def setup_logging() -> None:
             structlog.processors.StackInfoRenderer(),
             structlog.dev.set_exc_info,
             structlog.processors.TimeStamper(fmt="iso"),
-            (
-                structlog.dev.ConsoleRenderer()
-                if settings.debug
-                else structlog.processors.JSONRenderer()
-            ),
+            renderer,
         ],
         wrapper_class=structlog.make_filtering_bound_logger(
             logging.DEBUG if settings.debug else logging.INFO
         ),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=logger_factory,
         cache_logger_on_first_use=True,
     )
 
@@ -0,0 +1,31 @@
+"""JSON encoding backed by orjson, with stdlib fallbacks."""
+
+import json
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_json(content: Any) -> str:
+    """Serialize ``content`` to a JSON string, via orjson when it is installed."""
+    if orjson is None:
+        return json.dumps(content)
+    return orjson.dumps(content).decode()
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson when it is installed.
+
+    Use it on routes without a response model. Routes with one are already dumped
+    straight to bytes by pydantic-core, and a custom response class would bypass that.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
@@ -2,15 +2,21 @@
 
 from datetime import datetime, timedelta, timezone
 
-from jose import JWTError, jwt
+import jwt
+from anyio import to_thread
 from passlib.context import CryptContext
 
 from app.core.config import get_settings
 
 settings = get_settings()
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.bcrypt_rounds
+)
 
 ALGORITHM = "HS256"
+# Encoded once; PyJWT otherwise converts the str secret to bytes on every call
+_SECRET_KEY = settings.secret_key.encode()
+_ALGORITHMS = [ALGORITHM]
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -21,18 +27,28 @@ def hash_password(password: str) -> str:
     return pwd_context.hash(password)
 
 
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """verify_password on a worker thread so the KDF doesn't block the event loop."""
+    return await to_thread.run_sync(verify_password, plain_password, hashed_password)
+
+
+async def ahash_password(password: str) -> str:
+    """hash_password on a worker thread so the KDF doesn't block the event loop."""
+    return await to_thread.run_sync(hash_password, password)
+
+
 def create_access_token(subject: str, expires_delta: timedelta | None = None) -> str:
     expire = datetime.now(timezone.utc) + (
         expires_delta or timedelta(minutes=settings.access_token_expire_minutes)
     )
     payload = {"sub": subject, "exp": expire}
-    return jwt.encode(payload, settings.secret_key, algorithm=ALGORITHM)
+    return jwt.encode(payload, _SECRET_KEY, algorithm=ALGORITHM)
 
 
 def decode_access_token(token: str) -> str | None:
     """Decode JWT token and return the subject (user ID). Returns None if invalid."""
     try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=[ALGORITHM])
+        payload = jwt.decode(token, _SECRET_KEY, algorithms=_ALGORITHMS)
         return payload.get("sub")
-    except JWTError:
+    except jwt.InvalidTokenError:
         return None
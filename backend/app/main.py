@@ -6,6 +6,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.api.v1.router import api_router
 from app.core.config import get_settings
 from app.core.logging import setup_logging, get_logger
+from app.core.responses import ORJSONResponse
 from app.db.session import engine, Base, async_session_factory
 from app.db.seed import seed_dev_user
 from app.middleware.observability import MetricsMiddleware
@@ -72,6 +73,9 @@ async def lifespan(app: FastAPI):
 
     yield
 
+    from app.services.rag import close_anthropic_client
+
+    await close_anthropic_client()
     await engine.dispose()
     logger.info("app_shutdown")
 
@@ -120,7 +124,7 @@ app.add_middleware(
 app.include_router(api_router)
 
 
-@app.get("/")
+@app.get("/", response_class=ORJSONResponse)
 async def root():
     return {
         "app": settings.app_name,
@@ -48,6 +48,12 @@ RAG_QUERY_DURATION = Histogram(
     buckets=[0.5, 1.0, 2.0, 3.0, 5.0, 10.0, 15.0, 30.0],
 )
 
+LLM_PROMPT_TOKENS = Counter(
+    "intellidoc_llm_prompt_tokens_total",
+    "Prompt tokens sent to the LLM by prompt-cache outcome",
+    ["cache"],  # read, write or none
+)
+
 EMBEDDING_DURATION = Histogram(
     "intellidoc_embedding_duration_seconds",
     "Embedding generation latency",
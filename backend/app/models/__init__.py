@@ -1,5 +1,5 @@
-from app.models.document import Document, DocumentChunk
+from app.models.document import ChunkEmbedding, Document, DocumentChunk
 from app.models.session import ChatSession, ChatMessage
 from app.models.user import User
 
-__all__ = ["Document", "DocumentChunk", "ChatSession", "ChatMessage", "User"]
+__all__ = ["ChunkEmbedding", "Document", "DocumentChunk", "ChatSession", "ChatMessage", "User"]
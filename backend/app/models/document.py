@@ -11,6 +11,7 @@ from sqlalchemy import (
     ForeignKey,
     Enum,
     Index,
+    LargeBinary,
     func,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -99,3 +100,17 @@ class DocumentChunk(Base):
     )
 
     document = relationship("Document", back_populates="chunks")
+
+
+class ChunkEmbedding(Base):
+    """Content-addressed embedding cache keyed by SHA-256 of the chunk text."""
+
+    __tablename__ = "chunk_embeddings"
+
+    content_sha256: Mapped[bytes] = mapped_column(LargeBinary(32), primary_key=True)
+    model: Mapped[str] = mapped_column(String(255), primary_key=True)
+    # float32 vector, raw little-endian bytes
+    vector: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
@@ -1,45 +1,149 @@
 import re
+import sys
+from collections import Counter
 
 from app.core.logging import get_logger
 
 try:
-    from rank_bm25 import BM25Okapi
+    import numpy as np
 except ImportError:
-    BM25Okapi = None
+    np = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
 
 logger = get_logger(__name__)
 
+# Okapi BM25 parameters (same defaults as rank_bm25.BM25Okapi)
+K1 = 1.5
+B = 0.75
+EPSILON = 0.25
+
+_WORD_RE = re.compile(r"\w+")
+# Simple stop word removal
+_STOP_WORDS = frozenset(
+    {"the", "a", "an", "is", "are", "was", "were", "in", "on", "at", "to", "for", "of", "and", "or"}
+)
+
+
+def _accumulate_scores(indptr, postings, weights, term_ids, term_counts, scores):
+    """Add ``count * weight`` to ``scores`` for every posting of every query term.
+
+    JIT-compiled when numba is installed; compilation happens once per process on the
+    first search and is not cached to disk, so read-only deployments work. It runs
+    serially because postings of different terms hit the same documents, and the
+    per-document summation order matches the NumPy fallback in ``search`` so both give
+    identical scores.
+    """
+    for i in range(term_ids.shape[0]):
+        t = term_ids[i]
+        count = term_counts[i]
+        for j in range(indptr[t], indptr[t + 1]):
+            scores[postings[j]] += count * weights[j]
+
+
+if numba is not None:
+    _accumulate_scores = numba.njit(nogil=True)(_accumulate_scores)
+
 
 class BM25SearchService:
-    """Sparse retrieval using BM25 algorithm for hybrid search."""
+    """Sparse retrieval using BM25 algorithm for hybrid search.
+
+    Each namespace keeps a term-major sparse matrix (CSC of the doc-term matrix) whose
+    entries are the precomputed per-document BM25 weights, so a query is a scatter-add
+    over the postings of its terms rather than a Python pass over every document.
+    """
 
     def __init__(self):
-        self._indices: dict[str, dict] = {}  # namespace -> {bm25, chunks}
+        self._indices: dict[str, dict] = {}  # namespace -> {chunks, tokens, matrix arrays}
 
     @staticmethod
     def _tokenize(text: str) -> list[str]:
-        text = text.lower()
-        text = re.sub(r"[^\w\s]", " ", text)
-        tokens = text.split()
-        # Simple stop word removal
-        stop_words = {"the", "a", "an", "is", "are", "was", "were", "in", "on", "at", "to", "for", "of", "and", "or"}
-        return [t for t in tokens if t not in stop_words and len(t) > 1]
-
-    def build_index(self, namespace: str, chunks: list[dict]) -> None:
-        """Build BM25 index for a set of chunks."""
-        if BM25Okapi is None:
-            logger.warning("bm25_unavailable", reason="rank_bm25 not installed")
+        # Runs of word characters, i.e. what splitting after blanking punctuation yields
+        tokens = _WORD_RE.findall(text.lower())
+        return [t for t in tokens if t not in _STOP_WORDS and len(t) > 1]
+
+    @classmethod
+    def _tokenize_chunks(cls, chunks: list[dict]) -> list[list[str]]:
+        # Interned terms are shared by every cached token list and hit the identity
+        # fast path on vocabulary lookups (str hashes are already cached by CPython)
+        intern = sys.intern
+        return [[intern(t) for t in cls._tokenize(c["content"])] for c in chunks]
+
+    def build_index(
+        self,
+        namespace: str,
+        chunks: list[dict],
+        tokens: list[list[str]] | None = None,
+    ) -> None:
+        """Build BM25 index for a set of chunks.
+
+        ``tokens`` may carry already-tokenized chunk contents to skip re-tokenizing.
+        """
+        if np is None:
+            logger.warning("bm25_unavailable", reason="numpy not installed")
             return
-        tokenized_corpus = [self._tokenize(c["content"]) for c in chunks]
-        bm25 = BM25Okapi(tokenized_corpus)
-        self._indices[namespace] = {"bm25": bm25, "chunks": chunks}
+        if tokens is None:
+            tokens = self._tokenize_chunks(chunks)
+        self._indices[namespace] = {
+            "chunks": chunks,
+            "tokens": tokens,
+            **self._build_matrix(tokens),
+        }
         logger.info("bm25_index_built", namespace=namespace, doc_count=len(chunks))
 
+    @staticmethod
+    def _build_matrix(tokenized_corpus: list[list[str]]) -> dict:
+        vocab: dict[str, int] = {}
+        doc_idx: list[int] = []
+        term_idx: list[int] = []
+        term_freq: list[int] = []
+        for d, doc_tokens in enumerate(tokenized_corpus):
+            for term, count in Counter(doc_tokens).items():
+                doc_idx.append(d)
+                term_idx.append(vocab.setdefault(term, len(vocab)))
+                term_freq.append(count)
+
+        n_docs = len(tokenized_corpus)
+        docs = np.asarray(doc_idx, dtype=np.int32)
+        terms = np.asarray(term_idx, dtype=np.int32)
+        tf = np.asarray(term_freq, dtype=np.float64)
+
+        df = np.bincount(terms, minlength=len(vocab))
+        idf = np.log(n_docs - df + 0.5) - np.log(df + 0.5)
+        if len(vocab):
+            # Terms in more than half the corpus get a small positive floor, as in BM25Okapi
+            idf = np.where(idf < 0, EPSILON * idf.mean(), idf)
+
+        doc_len = np.fromiter((len(t) for t in tokenized_corpus), dtype=np.float64, count=n_docs)
+        avgdl = doc_len.mean() if n_docs else 0.0
+        weights = (
+            idf[terms] * tf * (K1 + 1)
+            / (tf + K1 * (1 - B + B * doc_len[docs] / (avgdl or 1.0)))
+        )
+
+        # Group postings by term: postings of term t live in [indptr[t], indptr[t + 1])
+        order = np.argsort(terms, kind="stable")
+        indptr = np.zeros(len(vocab) + 1, dtype=np.int64)
+        np.cumsum(df, out=indptr[1:])
+        return {
+            "vocab": vocab,
+            "indptr": indptr,
+            "postings": docs[order],
+            "weights": weights[order],
+            "n_docs": n_docs,
+        }
+
     def add_to_index(self, namespace: str, chunks: list[dict]) -> None:
         """Add chunks to an existing BM25 index (rebuilds)."""
-        existing = self._indices.get(namespace, {}).get("chunks", [])
-        all_chunks = existing + chunks
-        self.build_index(namespace, all_chunks)
+        existing = self._indices.get(namespace, {})
+        all_chunks = existing.get("chunks", []) + chunks
+        # IDF and average length are corpus-wide, so weights are recomputed, but
+        # existing chunks are not re-tokenized
+        tokens = existing.get("tokens", []) + self._tokenize_chunks(chunks)
+        self.build_index(namespace, all_chunks, tokens=tokens)
 
     def search(
         self,
@@ -53,34 +157,75 @@ class BM25SearchService:
         if not index_data:
             return []
 
-        bm25 = index_data["bm25"]
-        chunks = index_data["chunks"]
-
         tokenized_query = self._tokenize(query)
         if not tokenized_query:
             return []
 
-        scores = bm25.get_scores(tokenized_query)
-
-        # Pair scores with chunks and filter
-        scored_chunks = []
-        for i, (score, chunk) in enumerate(zip(scores, chunks)):
-            if filter_document_ids and chunk.get("document_id") not in filter_document_ids:
-                continue
-            if score > 0:
-                scored_chunks.append({**chunk, "bm25_score": float(score)})
+        vocab = index_data["vocab"]
+        indptr = index_data["indptr"]
+        postings = index_data["postings"]
+        weights = index_data["weights"]
+        chunks = index_data["chunks"]
 
-        # Sort by score descending
-        scored_chunks.sort(key=lambda x: x["bm25_score"], reverse=True)
-        return scored_chunks[:top_k]
+        term_ids: list[int] = []
+        term_counts: list[int] = []
+        for term, query_freq in Counter(tokenized_query).items():
+            t = vocab.get(term)
+            if t is not None:
+                term_ids.append(t)
+                term_counts.append(query_freq)
+
+        # Sparse mat-vec: query term counts times the weight columns of those terms
+        scores = np.zeros(index_data["n_docs"], dtype=np.float64)
+        if numba is not None:
+            _accumulate_scores(
+                indptr,
+                postings,
+                weights,
+                np.asarray(term_ids, dtype=np.int64),
+                np.asarray(term_counts, dtype=np.float64),
+                scores,
+            )
+        else:
+            for t, query_freq in zip(term_ids, term_counts):
+                start, end = indptr[t], indptr[t + 1]
+                # A document occurs at most once per term, so fancy-index += is safe
+                scores[postings[start:end]] += query_freq * weights[start:end]
+
+        mask = scores > 0
+        if filter_document_ids:
+            allowed = set(filter_document_ids)
+            mask &= np.fromiter(
+                (c.get("document_id") in allowed for c in chunks), dtype=bool, count=len(chunks)
+            )
+        candidates = np.flatnonzero(mask)
+        if 0 < top_k < len(candidates):
+            # Partition only finds the k-th best score; keep everything tied with it so
+            # the cut below is decided by corpus order, not by partition internals
+            cut = len(candidates) - top_k
+            kth = np.partition(scores[candidates], cut)[cut]
+            candidates = candidates[scores[candidates] >= kth]
+        # Sort by score descending, ties by corpus order (a stable sort, as before)
+        candidates = candidates[np.lexsort((candidates, -scores[candidates]))][:top_k]
+
+        return [
+            {**chunks[i], "bm25_score": float(scores[i])}
+            for i in candidates.tolist()
+        ]
 
     def remove_document(self, namespace: str, document_id: str) -> None:
         """Remove a document's chunks from the index and rebuild."""
         index_data = self._indices.get(namespace)
         if not index_data:
             return
-        remaining = [c for c in index_data["chunks"] if c.get("document_id") != document_id]
-        if remaining:
-            self.build_index(namespace, remaining)
+        keep = [
+            i for i, c in enumerate(index_data["chunks"]) if c.get("document_id") != document_id
+        ]
+        if keep:
+            self.build_index(
+                namespace,
+                [index_data["chunks"][i] for i in keep],
+                tokens=[index_data["tokens"][i] for i in keep],
+            )
         else:
             self._indices.pop(namespace, None)
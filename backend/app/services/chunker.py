@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 
 from app.core.config import get_settings
 from app.core.logging import get_logger
@@ -6,6 +7,33 @@ from app.core.logging import get_logger
 logger = get_logger(__name__)
 settings = get_settings()
 
+# Match common heading patterns
+_HEADING_RE = re.compile(
+    r"^(#{1,6}\s+.+|[A-Z][A-Z\s]{2,}$|\d+\.\s+[A-Z].+|Chapter\s+\d+.*)$",
+    re.MULTILINE,
+)
+# Split on sentence-ending punctuation followed by space and capital letter
+_SENTENCE_BREAK_RE = re.compile(r"(?<=[.!?])\s+(?=[A-Z])")
+
+
+@lru_cache(maxsize=1)
+def _get_encoder():
+    """Process-wide cl100k_base encoder (loading it parses a ~1.7 MB BPE table)."""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    return tiktoken.get_encoding("cl100k_base")
+
+
+def _count_tokens(text: str) -> int:
+    encoder = _get_encoder()
+    if encoder is not None:
+        # encode_ordinary skips the special-token scan and never raises on "<|...|>"
+        return len(encoder.encode_ordinary(text))
+    # Fallback: ~4 chars per token approximation
+    return len(text) // 4
+
 
 class SemanticChunker:
     """Splits text into semantically meaningful chunks preserving context boundaries."""
@@ -17,23 +45,13 @@ class SemanticChunker:
     ):
         self.chunk_size = chunk_size or settings.chunk_size
         self.chunk_overlap = chunk_overlap or settings.chunk_overlap
-        self._tokenizer = None
 
     @property
     def tokenizer(self):
-        if self._tokenizer is None:
-            try:
-                import tiktoken
-                self._tokenizer = tiktoken.get_encoding("cl100k_base")
-            except ImportError:
-                self._tokenizer = None
-        return self._tokenizer
+        return _get_encoder()
 
     def count_tokens(self, text: str) -> int:
-        if self.tokenizer:
-            return len(self.tokenizer.encode(text))
-        # Fallback: ~4 chars per token approximation
-        return len(text) // 4
+        return _count_tokens(text)
 
     def chunk_document(self, pages: list[dict]) -> list[dict]:
         """Split document pages into semantic chunks.
@@ -86,14 +104,8 @@ class SemanticChunker:
 
     def _split_into_sections(self, text: str) -> list[tuple[str | None, str]]:
         """Split text into sections based on headings and structural markers."""
-        # Match common heading patterns
-        heading_pattern = re.compile(
-            r"^(#{1,6}\s+.+|[A-Z][A-Z\s]{2,}$|\d+\.\s+[A-Z].+|Chapter\s+\d+.*)$",
-            re.MULTILINE,
-        )
-
         sections = []
-        matches = list(heading_pattern.finditer(text))
+        matches = list(_HEADING_RE.finditer(text))
 
         if not matches:
             return [(None, text)]
@@ -122,6 +134,8 @@ class SemanticChunker:
         sentences = self._split_sentences(text)
         chunks = []
         current_chunk: list[str] = []
+        # Token counts parallel to current_chunk; each sentence is encoded exactly once
+        current_counts: list[int] = []
         current_tokens = 0
 
         for sentence in sentences:
@@ -134,16 +148,18 @@ class SemanticChunker:
                 overlap_tokens = 0
                 overlap_start = len(current_chunk)
                 for j in range(len(current_chunk) - 1, -1, -1):
-                    t = self.count_tokens(current_chunk[j])
+                    t = current_counts[j]
                     if overlap_tokens + t > self.chunk_overlap:
                         break
                     overlap_tokens += t
                     overlap_start = j
 
                 current_chunk = current_chunk[overlap_start:]
-                current_tokens = sum(self.count_tokens(s) for s in current_chunk)
+                current_counts = current_counts[overlap_start:]
+                current_tokens = overlap_tokens
 
             current_chunk.append(sentence)
+            current_counts.append(sentence_tokens)
             current_tokens += sentence_tokens
 
         if current_chunk:
@@ -154,6 +170,5 @@ class SemanticChunker:
     @staticmethod
     def _split_sentences(text: str) -> list[str]:
         """Split text into sentences, preserving abbreviations and decimals."""
-        # Split on sentence-ending punctuation followed by space and capital letter
-        sentences = re.split(r"(?<=[.!?])\s+(?=[A-Z])", text)
+        sentences = _SENTENCE_BREAK_RE.split(text)
         return [s.strip() for s in sentences if s.strip()]
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import hashlib
+from typing import TYPE_CHECKING
+
 from app.core.config import get_settings
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 settings = get_settings()
 
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
 _model = None
 
 
@@ -19,6 +25,20 @@ def get_embedding_model():
     return _model
 
 
+_sparse_encoder = None
+
+
+def get_sparse_encoder():
+    """BM25 sparse encoder (pinecone-text) with pre-fitted corpus statistics."""
+    global _sparse_encoder
+    if _sparse_encoder is None:
+        from pinecone_text.sparse import BM25Encoder
+
+        logger.info("loading_sparse_encoder")
+        _sparse_encoder = BM25Encoder.default()
+    return _sparse_encoder
+
+
 class EmbeddingService:
     """Generate embeddings for text using sentence-transformers."""
 
@@ -32,9 +52,45 @@ class EmbeddingService:
             self._model = get_embedding_model()
         return self._model
 
-    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+    def embed_texts(self, texts: list[str], db: Session | None = None) -> list[list[float]]:
+        """Embed texts, reusing vectors cached in ``chunk_embeddings`` when a session is given."""
         if not texts:
             return []
+        if db is None:
+            return self._encode(texts)
+
+        import numpy as np
+        from sqlalchemy import select
+        from app.models.document import ChunkEmbedding
+
+        model_name = settings.embedding_model
+        hashes = [hashlib.sha256(t.encode()).digest() for t in texts]
+        rows = db.execute(
+            select(ChunkEmbedding.content_sha256, ChunkEmbedding.vector).where(
+                ChunkEmbedding.model == model_name,
+                ChunkEmbedding.content_sha256.in_(set(hashes)),
+            )
+        )
+        cached = {
+            row[0]: np.frombuffer(row[1], dtype=np.float32).tolist() for row in rows
+        }
+
+        # Deduplicate misses so repeated chunks (e.g. boilerplate footers) embed once
+        misses: dict[bytes, str] = {}
+        for h, text in zip(hashes, texts):
+            if h not in cached and h not in misses:
+                misses[h] = text
+
+        if misses:
+            fresh = self._encode(list(misses.values()))
+            for h, vector in zip(misses, fresh):
+                cached[h] = vector
+            self._store_cached(db, model_name, zip(misses, fresh))
+
+        logger.info("embedding_cache", hits=len(texts) - len(misses), misses=len(misses))
+        return [cached[h] for h in hashes]
+
+    def _encode(self, texts: list[str]) -> list[list[float]]:
         # Batch in groups of 32 to avoid memory issues on large documents
         all_embeddings = []
         batch_size = 32
@@ -44,10 +100,43 @@ class EmbeddingService:
             all_embeddings.extend(embeddings.tolist())
         return all_embeddings
 
+    @staticmethod
+    def _store_cached(db: Session, model_name: str, items) -> None:
+        import numpy as np
+        from app.models.document import ChunkEmbedding
+
+        values = [
+            {
+                "content_sha256": h,
+                "model": model_name,
+                "vector": np.asarray(vector, dtype=np.float32).tobytes(),
+            }
+            for h, vector in items
+        ]
+        dialect = db.get_bind().dialect.name
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        elif dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            return
+        db.execute(insert(ChunkEmbedding).values(values).on_conflict_do_nothing())
+
     def embed_query(self, query: str) -> list[float]:
         embedding = self.model.encode(query, normalize_embeddings=True, show_progress_bar=False)
         return embedding.tolist()
 
+    @staticmethod
+    def embed_sparse_documents(texts: list[str]) -> list[dict]:
+        """BM25 sparse vectors as Pinecone ``{"indices": [...], "values": [...]}`` dicts."""
+        if not texts:
+            return []
+        return get_sparse_encoder().encode_documents(texts)
+
+    @staticmethod
+    def embed_sparse_query(query: str) -> dict:
+        return get_sparse_encoder().encode_queries(query)
+
     @staticmethod
     def cosine_similarity(a: list[float], b: list[float]) -> float:
         import numpy as np
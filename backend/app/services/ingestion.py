@@ -11,6 +11,7 @@ from app.services.document_processor import DocumentProcessor
 from app.services.chunker import SemanticChunker
 from app.services.vector_store import VectorStoreService
 from app.services.bm25_search import BM25SearchService
+from app.services.rag_cache import get_rag_cache
 
 logger = get_logger(__name__)
 
@@ -114,6 +115,7 @@ class IngestionService:
                     chunks=chunks_data,
                     document_id=doc.id,
                     owner_id=owner_id,
+                    db=self.db,
                 )
                 for db_chunk, vector_id in zip(db_chunks, vector_ids):
                     db_chunk.vector_id = vector_id
@@ -132,6 +134,8 @@ class IngestionService:
                 for c in chunks_data
             ]
             self.bm25_service.add_to_index(str(owner_id), bm25_chunks)
+            # Any cached answer for this owner may now be missing the new document
+            get_rag_cache().invalidate_owner(owner_id)
 
             # 9. Mark as completed
             elapsed_ms = int((time.time() - start) * 1000)
@@ -168,6 +172,7 @@ class IngestionService:
 
         # Remove from BM25 index
         self.bm25_service.remove_document(str(owner_id), str(document_id))
+        get_rag_cache().invalidate_document(owner_id, document_id)
 
         # Delete from database (cascades to chunks)
         await self.db.delete(doc)
@@ -1,23 +1,72 @@
+import heapq
 import uuid
 import time
+from functools import lru_cache
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
 from app.core.logging import get_logger
+from app.middleware.observability import LLM_PROMPT_TOKENS
 from app.services.vector_store import VectorStoreService
 from app.services.bm25_search import BM25SearchService
+from app.services.rag_cache import RAGResponseCache, get_rag_cache
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 logger = get_logger(__name__)
 settings = get_settings()
 
-
+CONTEXT_SEPARATOR = "\n\n---\n\n"
+
+# RRF contributions 1 / (k + rank) for the default k, ranks 1.._RRF_MAX_RANK, so fusion
+# with k=60 slices a table instead of dividing per hit (same float64 values either way)
+RRF_K = 60
+_RRF_MAX_RANK = 4096
+_RRF_WEIGHTS = tuple(1.0 / (RRF_K + rank) for rank in range(1, _RRF_MAX_RANK + 1))
+_RRF_WEIGHTS_ARR = np.array(_RRF_WEIGHTS) if np is not None else None
+
+# Sent verbatim on every generation call; a single shared string object
+SYSTEM_PROMPT = (
+    "You are IntelliDoc Nexus, an intelligent document analysis assistant. "
+    "Your role is to answer questions based ONLY on the provided document excerpts. "
+    "Follow these rules:\n"
+    "1. Always cite sources using [Source N] notation when referencing information.\n"
+    "2. If the documents don't contain enough information to answer, say so clearly.\n"
+    "3. Be precise and factual - never fabricate information.\n"
+    "4. When synthesizing from multiple sources, reference each source.\n"
+    "5. Format responses clearly with paragraphs and bullet points when appropriate."
+)
+
+
+@lru_cache(maxsize=1)
 def _get_anthropic_client():
+    # One client per process keeps its httpx connection pool (and TLS sessions) warm
     import anthropic
     return anthropic.AsyncAnthropic(api_key=settings.anthropic_api_key)
 
 
+async def close_anthropic_client() -> None:
+    """Close the shared Anthropic client if one was created."""
+    if _get_anthropic_client.cache_info().currsize:
+        await _get_anthropic_client().close()
+        _get_anthropic_client.cache_clear()
+
+
+def _as_rrf_row_dense(rank: int, item: dict) -> tuple[str, dict]:
+    """(fusion key, payload) for a vector search hit."""
+    return item.get("vector_id", f"dense_{rank}"), item
+
+
+def _as_rrf_row_sparse(rank: int, item: dict) -> tuple[str, dict]:
+    """(fusion key, payload) for a BM25 hit."""
+    return f"{item.get('document_id')}_{item.get('chunk_index')}", item
+
+
 class RAGService:
     """Retrieval-Augmented Generation service combining retrieval with Claude."""
 
@@ -73,6 +122,10 @@ class RAGService:
             )
             if full_content:
                 ctx["full_content"] = full_content
+            # Resolve the preferred text once for both prompt and source assembly
+            ctx["_display_content"] = (
+                full_content or ctx.get("content_preview") or ctx.get("content", "")
+            )
 
     async def query(
         self,
@@ -85,6 +138,12 @@ class RAGService:
         """Execute RAG pipeline: retrieve context, generate answer with citations."""
         start = time.time()
 
+        cache, cache_key = self._cache_lookup_key(question, owner_id, document_ids, chat_history)
+        cached = cache.get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            logger.info("rag_cache_hit", question_len=len(question))
+            return {**cached, "latency_ms": int((time.time() - start) * 1000)}
+
         # 1. Retrieve relevant chunks via hybrid search
         contexts = await self._hybrid_search(
             query=question,
@@ -102,19 +161,18 @@ class RAGService:
 
         # 2. Resolve document names for source references
         await self._enrich_contexts(contexts)
+        contexts = self._dedupe_contexts(contexts)
 
-        # 3. Build context string with source markers
-        context_str = self._build_context(contexts)
+        # 3. Build prompt with source markers
+        prompt = self._generation_prompt(question, contexts, chat_history)
 
         # 3. Generate response with Claude
-        messages = self._build_messages(question, context_str, chat_history)
-
         response = await _get_anthropic_client().messages.create(
             model=settings.claude_model,
             max_tokens=4096,
-            system=self._system_prompt(),
-            messages=messages,
+            **prompt,
         )
+        self._record_prompt_usage(getattr(response, "usage", None))
 
         content = response.content[0].text
 
@@ -130,11 +188,14 @@ class RAGService:
             latency_ms=latency_ms,
         )
 
-        return {
+        result = {
             "content": content,
             "sources": sources,
             "latency_ms": latency_ms,
         }
+        if cache_key is not None:
+            cache.set(cache_key, owner_id, result)
+        return result
 
     async def query_stream(
         self,
@@ -145,6 +206,15 @@ class RAGService:
         top_k: int = 8,
     ):
         """Stream RAG response for real-time UI updates."""
+        cache, cache_key = self._cache_lookup_key(question, owner_id, document_ids, chat_history)
+        cached = cache.get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            logger.info("rag_cache_hit", question_len=len(question))
+            yield {"type": "text", "content": cached["content"]}
+            yield {"type": "sources", "sources": cached["sources"]}
+            yield {"type": "done"}
+            return
+
         contexts = await self._hybrid_search(
             query=question,
             owner_id=owner_id,
@@ -162,22 +232,43 @@ class RAGService:
             return
 
         await self._enrich_contexts(contexts)
-        context_str = self._build_context(contexts)
-        messages = self._build_messages(question, context_str, chat_history)
+        contexts = self._dedupe_contexts(contexts)
+        prompt = self._generation_prompt(question, contexts, chat_history)
 
         async with _get_anthropic_client().messages.stream(
             model=settings.claude_model,
             max_tokens=4096,
-            system=self._system_prompt(),
-            messages=messages,
+            **prompt,
         ) as stream:
+            # Only collect the text when there is a cache to store it in
+            parts = [] if cache_key is not None else None
             async for text in stream.text_stream:
+                if parts is not None:
+                    parts.append(text)
                 yield {"type": "text", "content": text}
+            self._record_prompt_usage((await stream.get_final_message()).usage)
 
         sources = self._extract_sources(contexts)
+        # Only a fully streamed answer is cached; an abandoned stream never gets here
+        if parts is not None:
+            cache.set(cache_key, owner_id, {"content": "".join(parts), "sources": sources})
         yield {"type": "sources", "sources": sources}
         yield {"type": "done"}
 
+    @staticmethod
+    def _cache_lookup_key(
+        question: str,
+        owner_id: uuid.UUID,
+        document_ids: list[uuid.UUID] | None,
+        chat_history: list[dict] | None,
+    ) -> tuple[RAGResponseCache, str | None]:
+        """The answer cache and this request's key, or ``None`` when the cache is off."""
+        cache = get_rag_cache()
+        if not cache.enabled:
+            # Off by default: skip hashing the history and counting misses
+            return cache, None
+        return cache, cache.make_key(question, owner_id, document_ids, chat_history)
+
     async def _hybrid_search(
         self,
         query: str,
@@ -186,17 +277,29 @@ class RAGService:
         top_k: int = 10,
     ) -> list[dict]:
         """Combine dense (vector) and sparse (BM25) search results."""
+        # Stringify once; both retrievers filter on the string form
+        filter_ids = [str(d) for d in document_ids] if document_ids else None
+
+        if self.vector_store.supports_sparse():
+            # Sparse vectors live in Pinecone: one sparse-dense query, no BM25 pass or RRF
+            return await self.vector_store.search(
+                query=query,
+                owner_id=owner_id,
+                top_k=top_k,
+                filter_document_ids=filter_ids,
+                hybrid=True,
+            )
+
         # Dense search via Pinecone
         dense_results = await self.vector_store.search(
             query=query,
             owner_id=owner_id,
             top_k=top_k,
-            filter_document_ids=document_ids,
+            filter_document_ids=filter_ids,
         )
 
         # Sparse search via BM25
         namespace = str(owner_id)
-        filter_ids = [str(d) for d in document_ids] if document_ids else None
         sparse_results = self.bm25_service.search(
             query=query,
             namespace=namespace,
@@ -212,97 +315,231 @@ class RAGService:
         dense: list[dict],
         sparse: list[dict],
         top_k: int,
-        k: int = 60,
+        k: int = RRF_K,
     ) -> list[dict]:
         """Combine ranked lists using Reciprocal Rank Fusion (RRF)."""
-        scores: dict[str, float] = {}
-        result_map: dict[str, dict] = {}
-
-        for rank, item in enumerate(dense):
-            key = item.get("vector_id", f"dense_{rank}")
-            scores[key] = scores.get(key, 0) + 1.0 / (k + rank + 1)
-            result_map[key] = item
-
-        for rank, item in enumerate(sparse):
-            key = f"{item.get('document_id')}_{item.get('chunk_index')}"
-            scores[key] = scores.get(key, 0) + 1.0 / (k + rank + 1)
-            if key not in result_map:
-                result_map[key] = item
+        if not dense or not sparse:
+            # One retriever only: its hits are unique and 1/(k + rank) falls with rank,
+            # so the list is already in fused order and needs no accumulation
+            results = (dense or sparse)[:top_k]
+            if k == RRF_K and len(results) <= _RRF_MAX_RANK:
+                weights = _RRF_WEIGHTS
+            else:
+                weights = [1.0 / (k + rank) for rank in range(1, len(results) + 1)]
+            for item, weight in zip(results, weights):
+                item["rrf_score"] = weight
+            return results
+
+        rows = [_as_rrf_row_dense(rank, item) for rank, item in enumerate(dense)]
+        rows += [_as_rrf_row_sparse(rank, item) for rank, item in enumerate(sparse)]
+        use_table = k == RRF_K and max(len(dense), len(sparse)) <= _RRF_MAX_RANK
+
+        # Give every distinct candidate a slot; the first payload seen for a key is kept,
+        # so a dense hit wins over the same chunk found by BM25
+        slot_of: dict[str, int] = {}
+        items: list[dict] = []
+        slots: list[int] = []
+        for key, item in rows:
+            slot = slot_of.get(key)
+            if slot is None:
+                slot = slot_of[key] = len(items)
+                items.append(item)
+            slots.append(slot)
+
+        if np is None:
+            if use_table:
+                weights = [*_RRF_WEIGHTS[: len(dense)], *_RRF_WEIGHTS[: len(sparse)]]
+            else:
+                ranks = [*range(1, len(dense) + 1), *range(1, len(sparse) + 1)]
+                weights = [1.0 / (k + rank) for rank in ranks]
+            scores = [0.0] * len(items)
+            for slot, weight in zip(slots, weights):
+                scores[slot] += weight
+            # Partial selection: O(n log top_k) instead of sorting every candidate
+            top_slots = heapq.nlargest(top_k, range(len(items)), key=scores.__getitem__)
+        else:
+            if use_table:
+                weights = np.concatenate(
+                    (_RRF_WEIGHTS_ARR[: len(dense)], _RRF_WEIGHTS_ARR[: len(sparse)])
+                )
+            else:
+                ranks = np.concatenate((np.arange(1, len(dense) + 1), np.arange(1, len(sparse) + 1)))
+                weights = 1.0 / (k + ranks.astype(np.float64))
+            # bincount sums each slot's contributions in input order, exactly like the loop
+            score_arr = np.bincount(
+                np.asarray(slots, dtype=np.intp), weights=weights, minlength=len(items)
+            )
+            candidates = np.arange(len(items))
+            if 0 < top_k < len(items):
+                # O(n) partition finds the k-th best score; keeping everything that ties
+                # with it means only the survivors need sorting, with no tie dropped
+                kth = np.partition(score_arr, len(items) - top_k)[len(items) - top_k]
+                candidates = np.flatnonzero(score_arr >= kth)
+            # Stable over ascending slots: ties keep first-seen order, as heapq.nlargest does
+            order = np.argsort(-score_arr[candidates], kind="stable")[:top_k]
+            top_slots = candidates[order].tolist()
+            scores = score_arr.tolist()
 
-        sorted_keys = sorted(scores, key=lambda x: scores[x], reverse=True)
         results = []
-        for key in sorted_keys[:top_k]:
-            item = result_map[key]
-            item["rrf_score"] = scores[key]
+        for slot in top_slots:
+            item = items[slot]
+            item["rrf_score"] = scores[slot]
             results.append(item)
 
         return results
 
     @staticmethod
-    def _build_context(contexts: list[dict]) -> str:
-        parts = []
-        for i, ctx in enumerate(contexts):
-            source_id = i + 1
-            doc_name = ctx.get("document_name") or ctx.get("document_id", "unknown")
-            page = ctx.get("page_number", "?")
+    def _dedupe_contexts(contexts: list[dict]) -> list[dict]:
+        """Drop repeat chunks that fusion returned under both a vector id and a BM25 key."""
+        seen: set[tuple] = set()
+        unique = []
+        for ctx in contexts:
+            key = (ctx.get("document_id"), ctx.get("chunk_index"))
+            if key[0] is not None and key[1] is not None:
+                if key in seen:
+                    continue
+                seen.add(key)
+            unique.append(ctx)
+        return unique
+
+    @staticmethod
+    def _display_content(ctx: dict) -> str:
+        """Text to show for a context, as resolved by ``_enrich_contexts`` when available."""
+        content = ctx.get("_display_content")
+        if content is None:
             # Prefer full content from DB, fall back to content_preview from Pinecone
             content = (
                 ctx.get("full_content")
                 or ctx.get("content_preview")
                 or ctx.get("content", "")
             )
-            parts.append(
-                f"[Source {source_id}] (Document: {doc_name}, Page: {page})\n{content}"
-            )
-        return "\n\n---\n\n".join(parts)
+        return content
+
+    @staticmethod
+    def _build_context(contexts: list[dict]) -> str:
+        # One f-string per source and a single join; join() takes a list without copying
+        display = RAGService._display_content
+        return CONTEXT_SEPARATOR.join([
+            f"[Source {source_id}] (Document: {ctx.get('document_name') or ctx.get('document_id', 'unknown')}, "
+            f"Page: {ctx.get('page_number', '?')})\n{display(ctx)}"
+            for source_id, ctx in enumerate(contexts, 1)
+        ])
 
     @staticmethod
     def _build_messages(
         question: str,
-        context: str,
+        context: str | None,
         chat_history: list[dict] | None = None,
     ) -> list[dict]:
-        messages = []
-        if chat_history:
-            for msg in chat_history[-10:]:  # Keep last 10 messages for context
-                messages.append({"role": msg["role"], "content": msg["content"]})
-
-        user_msg = (
-            f"Based on the following document excerpts, answer the question. "
-            f"Always cite your sources using [Source N] notation.\n\n"
-            f"DOCUMENT EXCERPTS:\n{context}\n\n"
-            f"QUESTION: {question}"
-        )
+        """Chat turns for generation; ``context=None`` means the excerpts are in the system prompt.
+
+        ``chat_history`` entries are already ``{"role", "content"}`` dicts and are reused as-is.
+        """
+        # Keep last 10 messages for context; the slice is a new list, safe to append to
+        messages = chat_history[-10:] if chat_history else []
+
+        if context is None:
+            user_msg = (
+                f"Based on the provided document excerpts, answer the question. "
+                f"Always cite your sources using [Source N] notation.\n\n"
+                f"QUESTION: {question}"
+            )
+        else:
+            user_msg = (
+                f"Based on the following document excerpts, answer the question. "
+                f"Always cite your sources using [Source N] notation.\n\n"
+                f"DOCUMENT EXCERPTS:\n{context}\n\n"
+                f"QUESTION: {question}"
+            )
         messages.append({"role": "user", "content": user_msg})
         return messages
 
+    @staticmethod
+    def _generation_prompt(
+        question: str,
+        contexts: list[dict],
+        chat_history: list[dict] | None = None,
+    ) -> dict:
+        """``system`` and ``messages`` arguments for a generation call.
+
+        With prompt caching on, the system prompt and the excerpts form a prefix that
+        does not depend on the question or chat history, marked as a cache breakpoint,
+        so follow-up questions that retrieve the same chunks reuse it. Excerpts are put
+        in document order (see ``_prompt_order``) to make the prefix independent of how
+        each query happened to rank them.
+        """
+        if not settings.anthropic_prompt_cache:
+            return {
+                "system": RAGService._system_prompt(),
+                "messages": RAGService._build_messages(
+                    question, RAGService._build_context(contexts), chat_history
+                ),
+            }
+
+        excerpts = RAGService._build_context(RAGService._prompt_order(contexts))
+        return {
+            "system": [
+                {"type": "text", "text": SYSTEM_PROMPT},
+                {
+                    "type": "text",
+                    "text": f"DOCUMENT EXCERPTS:\n{excerpts}",
+                    "cache_control": {"type": "ephemeral"},
+                },
+            ],
+            "messages": RAGService._build_messages(question, None, chat_history),
+        }
+
+    @staticmethod
+    def _record_prompt_usage(usage) -> None:
+        """Count prompt tokens by cache outcome; hit rate = read / (read + write + none)."""
+        if usage is None:
+            return
+        read = getattr(usage, "cache_read_input_tokens", None) or 0
+        written = getattr(usage, "cache_creation_input_tokens", None) or 0
+        uncached = getattr(usage, "input_tokens", None) or 0
+        LLM_PROMPT_TOKENS.labels(cache="read").inc(read)
+        LLM_PROMPT_TOKENS.labels(cache="write").inc(written)
+        LLM_PROMPT_TOKENS.labels(cache="none").inc(uncached)
+        if settings.anthropic_prompt_cache:
+            total = read + written + uncached
+            logger.info(
+                "rag_prompt_cache",
+                cache_read_tokens=read,
+                cache_write_tokens=written,
+                uncached_tokens=uncached,
+                hit_rate=round(read / total, 3) if total else 0.0,
+            )
+
     @staticmethod
     def _system_prompt() -> str:
-        return (
-            "You are IntelliDoc Nexus, an intelligent document analysis assistant. "
-            "Your role is to answer questions based ONLY on the provided document excerpts. "
-            "Follow these rules:\n"
-            "1. Always cite sources using [Source N] notation when referencing information.\n"
-            "2. If the documents don't contain enough information to answer, say so clearly.\n"
-            "3. Be precise and factual - never fabricate information.\n"
-            "4. When synthesizing from multiple sources, reference each source.\n"
-            "5. Format responses clearly with paragraphs and bullet points when appropriate."
+        return SYSTEM_PROMPT
+
+    @staticmethod
+    def _prompt_order(contexts: list[dict]) -> list[dict]:
+        """Order in which excerpts are numbered in the prompt: document order when prompt
+        caching is on, relevance order otherwise. Returns a new list when it reorders."""
+        if not settings.anthropic_prompt_cache:
+            return contexts
+        return sorted(
+            contexts, key=lambda c: (str(c.get("document_id")), c.get("chunk_index") or 0)
         )
 
     @staticmethod
     def _extract_sources(contexts: list[dict]) -> list[dict]:
-        sources = []
-        for i, ctx in enumerate(contexts):
-            score = ctx.get("rrf_score", ctx.get("score", 0))
-            sources.append({
-                "source_index": i + 1,
+        """Sources in relevance order, each carrying the [Source N] label used in the prompt."""
+        display = RAGService._display_content
+        labels = {id(ctx): n for n, ctx in enumerate(RAGService._prompt_order(contexts), 1)}
+        return [
+            {
+                "source_index": labels[id(ctx)],
                 "document_id": ctx.get("document_id"),
                 "document_name": ctx.get("document_name", ""),
                 "chunk_index": ctx.get("chunk_index"),
                 "page_number": ctx.get("page_number"),
                 "section_title": ctx.get("section_title", ""),
-                "content_preview": (ctx.get("content_preview") or ctx.get("content", ""))[:200],
-                "score": score,
+                "content_preview": display(ctx)[:200],
+                "score": (score := ctx.get("rrf_score", ctx.get("score", 0))),
                 "relevance_score": score,
-            })
-        return sources
+            }
+            for ctx in contexts
+        ]
@@ -0,0 +1,113 @@
+import hashlib
+import time
+import uuid
+from collections import OrderedDict
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+
+class RAGResponseCache:
+    """In-process TTL + LRU cache of RAG answers.
+
+    Entries are keyed by owner, normalized question, document filter and recent chat
+    history, so a hit skips both retrieval and generation. Being per-process, entries
+    are invalidated when this process ingests or deletes a document and otherwise
+    expire after ``ttl_seconds``.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 300.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # key -> (expires_at, owner_id, cited document ids, response); oldest first
+        self._entries: OrderedDict[str, tuple[float, str, frozenset[str], dict]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    @staticmethod
+    def make_key(
+        question: str,
+        owner_id: uuid.UUID,
+        document_ids: list[uuid.UUID] | None = None,
+        chat_history: list[dict] | None = None,
+    ) -> str:
+        normalized = " ".join(question.lower().split())
+        doc_filter = ",".join(sorted(str(d) for d in document_ids)) if document_ids else "*"
+        # Same window of history the prompt uses
+        history = "\x1e".join(
+            f"{m['role']}\x1f{m['content']}" for m in (chat_history or [])[-10:]
+        )
+        raw = "\x1d".join((str(owner_id), doc_filter, history, normalized))
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def get(self, key: str) -> dict | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return self._copy(entry[3])
+
+    def set(self, key: str, owner_id: uuid.UUID, response: dict) -> None:
+        if not self.enabled:
+            return
+        cited = frozenset(
+            str(s["document_id"]) for s in response.get("sources", []) if s.get("document_id")
+        )
+        self._entries[key] = (
+            time.monotonic() + self.ttl_seconds, str(owner_id), cited, self._copy(response)
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    @staticmethod
+    def _copy(response: dict) -> dict:
+        # Callers get (and hand in) their own sources list, so no one mutates a cached entry
+        return {**response, "sources": [dict(s) for s in response.get("sources", [])]}
+
+    def invalidate_document(self, owner_id: uuid.UUID, document_id: uuid.UUID) -> int:
+        """Drop the owner's answers that cite a removed or changed document."""
+        owner, doc = str(owner_id), str(document_id)
+        stale = [k for k, e in self._entries.items() if e[1] == owner and doc in e[2]]
+        for key in stale:
+            del self._entries[key]
+        if stale:
+            logger.info("rag_cache_invalidated", document_id=doc, entries=len(stale))
+        return len(stale)
+
+    def invalidate_owner(self, owner_id: uuid.UUID) -> int:
+        """Drop all of an owner's answers, e.g. after a new document could change them."""
+        owner = str(owner_id)
+        stale = [k for k, e in self._entries.items() if e[1] == owner]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_rag_cache: RAGResponseCache | None = None
+
+
+def get_rag_cache() -> RAGResponseCache:
+    global _rag_cache
+    if _rag_cache is None:
+        _rag_cache = RAGResponseCache(
+            max_entries=settings.rag_cache_max_entries,
+            ttl_seconds=settings.rag_cache_ttl_seconds,
+        )
+    return _rag_cache
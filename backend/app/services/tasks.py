@@ -2,7 +2,7 @@
 
 import uuid
 import asyncio
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 try:
     from celery import shared_task
@@ -26,13 +26,45 @@ settings = get_settings()
 _sync_engine = None
 _SyncSession = None
 
+# Sized for Celery worker concurrency; SQLAlchemy's default (5) queues callers
+# on "QueuePool limit reached" under modest load
+SYNC_POOL_SIZE = 10
+SYNC_MAX_OVERFLOW = 20
+
+
+def _prewarm_pool(engine, size: int) -> None:
+    """Open and release ``size`` connections so the first tasks skip connect latency."""
+    conns = []
+    try:
+        for _ in range(size):
+            conns.append(engine.connect())
+    except Exception as e:
+        logger.warning("sync_pool_prewarm_failed", error=str(e))
+    finally:
+        for conn in conns:
+            conn.close()
+
 
 def _get_sync_session():
     global _sync_engine, _SyncSession
     if _SyncSession is None:
         from sqlalchemy import create_engine
         from sqlalchemy.orm import Session, sessionmaker
-        _sync_engine = create_engine(settings.database_url_sync, pool_pre_ping=True)
+
+        # QueuePool params and libpq options only apply to postgresql, not sqlite
+        engine_kwargs: dict = {"pool_pre_ping": True}
+        is_postgres = settings.database_url_sync.startswith("postgresql")
+        if is_postgres:
+            engine_kwargs.update({
+                "pool_size": SYNC_POOL_SIZE,
+                "max_overflow": SYNC_MAX_OVERFLOW,
+                "pool_recycle": 1800,
+                # Short OLTP queries never benefit from JIT; it only adds planning latency
+                "connect_args": {"options": "-c jit=off"},
+            })
+        _sync_engine = create_engine(settings.database_url_sync, **engine_kwargs)
+        if is_postgres:
+            _prewarm_pool(_sync_engine, SYNC_POOL_SIZE)
         _SyncSession = sessionmaker(_sync_engine, class_=Session)
     return _SyncSession
 
@@ -113,7 +145,8 @@ def process_document_task(self, document_id: str, file_content_hex: str, filenam
 
             embedding_service = EmbeddingService()
             texts = [c["content"] for c in chunks_data]
-            _embeddings = embedding_service.embed_texts(texts)
+            _embeddings = embedding_service.embed_texts(texts, db=db)
+            db.commit()
 
             # Note: Vector store upsert would happen here with Pinecone
             # Skipped in background task for now — handled by the sync ingestion path
@@ -149,19 +182,23 @@ def process_document_task(self, document_id: str, file_content_hex: str, filenam
 @shared_task(name="cleanup_failed_documents")
 def cleanup_failed_documents():
     """Periodic task to clean up documents stuck in PROCESSING state."""
-    from sqlalchemy import select
+    from sqlalchemy import update
     from app.models.document import Document, DocumentStatus
 
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=1)
     with _get_sync_session()() as db:
-        stuck_docs = db.execute(
-            select(Document).where(Document.status == DocumentStatus.PROCESSING)
-        ).scalars().all()
-
-        for doc in stuck_docs:
-            age_hours = (datetime.now(timezone.utc) - doc.created_at.replace(tzinfo=timezone.utc)).total_seconds() / 3600
-            if age_hours > 1:
-                doc.status = DocumentStatus.FAILED
-                doc.error_message = "Processing timed out"
-                logger.warning("stuck_document_cleaned", document_id=str(doc.id))
-
+        # One server-side UPDATE instead of loading every PROCESSING row
+        result = db.execute(
+            update(Document)
+            .where(
+                Document.status == DocumentStatus.PROCESSING,
+                Document.created_at < cutoff,
+            )
+            .values(status=DocumentStatus.FAILED, error_message="Processing timed out")
+            .execution_options(synchronize_session=False)
+        )
         db.commit()
+
+    if result.rowcount:
+        logger.warning("stuck_documents_cleaned", count=result.rowcount)
+    return result.rowcount
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import uuid
+from typing import TYPE_CHECKING
 
 from app.core.config import get_settings
 from app.core.logging import get_logger
@@ -8,12 +9,27 @@ from app.core.logging import get_logger
 logger = get_logger(__name__)
 settings = get_settings()
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def quantize_int8(embeddings: list[list[float]]) -> tuple[list[list[int]], list[float]]:
+    """Symmetric per-vector int8 quantization; returns (values, dequantization scales)."""
+    import numpy as np
+
+    emb = np.asarray(embeddings, dtype=np.float32)
+    max_abs = np.max(np.abs(emb), axis=1, keepdims=True)
+    scale = np.where(max_abs > 0, max_abs / 127.0, 1.0)
+    quantized = np.round(emb / scale).astype(np.int8)
+    return quantized.tolist(), scale.ravel().tolist()
+
 
 class VectorStoreService:
     """Manages vector storage and retrieval via Pinecone."""
 
     def __init__(self):
         self._index = None
+        self._index_metric: str | None = None
         self._embedding_service = None
 
     @property
@@ -26,6 +42,11 @@ class VectorStoreService:
 
     @property
     def index(self):
+        self._ensure_index()
+        return self._index
+
+    def _ensure_index(self) -> str | None:
+        """Connect to (creating if needed) the Pinecone index and return its metric."""
         if self._index is None:
             if not settings.pinecone_api_key:
                 raise RuntimeError(
@@ -36,33 +57,69 @@ class VectorStoreService:
 
             pc = Pinecone(api_key=settings.pinecone_api_key)
 
-            existing = [idx.name for idx in pc.list_indexes()]
-            if settings.pinecone_index_name not in existing:
+            existing = {idx.name: idx for idx in pc.list_indexes()}
+            if settings.pinecone_index_name in existing:
+                # The metric is fixed at creation, so trust the index over current settings
+                self._index_metric = existing[settings.pinecone_index_name].metric
+            else:
                 logger.info("creating_pinecone_index", name=settings.pinecone_index_name)
+                # Sparse-dense vectors are only supported on dotproduct indexes
+                self._index_metric = "dotproduct" if settings.pinecone_hybrid else "cosine"
                 pc.create_index(
                     name=settings.pinecone_index_name,
                     dimension=settings.embedding_dimension,
-                    metric="cosine",
+                    metric=self._index_metric,
                     spec=ServerlessSpec(cloud="aws", region=settings.pinecone_environment),
                 )
 
             self._index = pc.Index(settings.pinecone_index_name)
             logger.info("pinecone_index_ready", name=settings.pinecone_index_name)
-        return self._index
+            if settings.pinecone_hybrid and self._index_metric != "dotproduct":
+                logger.warning(
+                    "pinecone_hybrid_unsupported",
+                    name=settings.pinecone_index_name,
+                    metric=self._index_metric,
+                )
+        return self._index_metric
+
+    def supports_sparse(self) -> bool:
+        """Whether native sparse-dense search is on and the live index can hold it.
+
+        Sparse values are only accepted by dotproduct indexes; an existing cosine index
+        keeps dense-only vectors and callers fall back to BM25 + RRF.
+        """
+        return settings.pinecone_hybrid and self._ensure_index() == "dotproduct"
 
     async def upsert_chunks(
         self,
         chunks: list[dict],
         document_id: uuid.UUID,
         owner_id: uuid.UUID,
+        db: AsyncSession | None = None,
     ) -> list[str]:
         texts = [c["content"] for c in chunks]
-        embeddings = self.embedding_service.embed_texts(texts)
+        if db is not None:
+            # Embedding cache lives in the DB; run the sync lookup on the session's connection
+            embeddings = await db.run_sync(
+                lambda session: self.embedding_service.embed_texts(texts, db=session)
+            )
+        else:
+            embeddings = self.embedding_service.embed_texts(texts)
+        if settings.pinecone_int8_vectors and embeddings and self._ensure_index() == "cosine":
+            # Opt-in and lossy: cosine ignores each vector's scale but not the rounding
+            # error, so near-tied chunks can swap ranks. Dotproduct needs the raw floats.
+            # The scales are not stored, so the original floats cannot be recovered.
+            embeddings, _ = quantize_int8(embeddings)
+        sparse_embeddings = (
+            self.embedding_service.embed_sparse_documents(texts)
+            if self.supports_sparse()
+            else [None] * len(texts)
+        )
         namespace = str(owner_id)
 
         vectors = []
         vector_ids = []
-        for chunk, embedding in zip(chunks, embeddings):
+        for chunk, embedding, sparse in zip(chunks, embeddings, sparse_embeddings):
             vector_id = f"{document_id}_{chunk['chunk_index']}"
             vector_ids.append(vector_id)
             metadata = {
@@ -76,11 +133,15 @@ class VectorStoreService:
                 metadata["page_number"] = chunk["page_number"]
             if chunk.get("section_title"):
                 metadata["section_title"] = chunk["section_title"]
-            vectors.append({
+            vector = {
                 "id": vector_id,
                 "values": embedding,
                 "metadata": metadata,
-            })
+            }
+            # Pinecone rejects empty sparse vectors (e.g. chunks of only stop words)
+            if sparse and sparse["indices"]:
+                vector["sparse_values"] = sparse
+            vectors.append(vector)
 
         batch_size = 100
         for i in range(0, len(vectors), batch_size):
@@ -99,23 +160,46 @@ class VectorStoreService:
         query: str,
         owner_id: uuid.UUID,
         top_k: int = 10,
-        filter_document_ids: list[uuid.UUID] | None = None,
+        filter_document_ids: list[uuid.UUID] | list[str] | None = None,
+        hybrid: bool = False,
     ) -> list[dict]:
+        """Dense search, or a single sparse-dense query when ``hybrid`` is set.
+
+        Hybrid mode weights the dense vector by ``hybrid_alpha`` and the BM25 sparse
+        vector by ``1 - hybrid_alpha`` so Pinecone scores both legs server-side. It
+        degrades to a plain dense query when the index cannot hold sparse values.
+        """
         query_embedding = self.embedding_service.embed_query(query)
         namespace = str(owner_id)
 
-        filter_dict = {}
-        if filter_document_ids:
-            filter_dict["document_id"] = {
-                "$in": [str(did) for did in filter_document_ids]
-            }
+        sparse_vector = None
+        if hybrid and self.supports_sparse():
+            alpha = settings.hybrid_alpha
+            sparse = self.embedding_service.embed_sparse_query(query)
+            query_embedding = [v * alpha for v in query_embedding]
+            if sparse["indices"]:
+                sparse_vector = {
+                    "indices": sparse["indices"],
+                    "values": [v * (1 - alpha) for v in sparse["values"]],
+                }
+
+        filter_dict = (
+            {"document_id": {"$in": [str(did) for did in filter_document_ids]}}
+            if filter_document_ids
+            else None
+        )
+
+        query_kwargs = {}
+        if sparse_vector is not None:
+            query_kwargs["sparse_vector"] = sparse_vector
 
         results = self.index.query(
             vector=query_embedding,
             top_k=top_k,
             namespace=namespace,
             include_metadata=True,
-            filter=filter_dict if filter_dict else None,
+            filter=filter_dict,
+            **query_kwargs,
         )
 
         matches = []
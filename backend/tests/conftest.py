@@ -5,31 +5,70 @@ os.environ["DATABASE_URL"] = "sqlite+aiosqlite:///./test.db"
 os.environ["DATABASE_URL_SYNC"] = "sqlite:///./test.db"
 os.environ["APP_ENV"] = "test"
 os.environ["DEBUG"] = "false"
+# HS256 keys under 32 bytes trigger PyJWT's InsecureKeyLengthWarning
+os.environ["SECRET_KEY"] = "test-secret-key-for-hs256-signing-only"
 
-import asyncio
+import functools
 import uuid
 from collections.abc import AsyncGenerator
 
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncSession,
+    create_async_engine,
+    async_sessionmaker,
+)
+from sqlalchemy.pool import StaticPool
 
 from app.db.session import Base, get_db
 from app.main import app
 from app.api.deps import get_current_user_id
+from app.api.v1.endpoints import auth as auth_endpoints
+from app.core import security
 
-# Use SQLite for tests
-TEST_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
+# Single shared in-memory SQLite database: the schema is created once per session
+# and every test runs inside a transaction that is rolled back afterwards.
+# Under pytest-xdist each worker gets its own database.
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "main")
+TEST_DATABASE_URL = (
+    f"sqlite+aiosqlite:///file:intellidoc_test_{XDIST_WORKER}?mode=memory&cache=shared&uri=true"
+)
 
-engine_test = create_async_engine(TEST_DATABASE_URL, echo=False)
-async_session_test = async_sessionmaker(engine_test, class_=AsyncSession, expire_on_commit=False)
+engine_test = create_async_engine(TEST_DATABASE_URL, echo=False, poolclass=StaticPool)
+
+
+# pysqlite's implicit transaction handling breaks SAVEPOINT; let SQLAlchemy emit BEGIN
+@event.listens_for(engine_test.sync_engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(engine_test.sync_engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
+
+_test_connection: AsyncConnection | None = None
 
 TEST_USER_ID = uuid.UUID("00000000-0000-0000-0000-000000000099")
 
 
+def _session_factory() -> async_sessionmaker[AsyncSession]:
+    # Commits inside the app only release a SAVEPOINT of the per-test transaction
+    return async_sessionmaker(
+        bind=_test_connection,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
+
+
 async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
-    async with async_session_test() as session:
+    async with _session_factory()() as session:
         try:
             yield session
             await session.commit()
@@ -46,30 +85,81 @@ app.dependency_overrides[get_db] = override_get_db
 app.dependency_overrides[get_current_user_id] = override_get_user_id
 
 
-@pytest.fixture(scope="session")
-def event_loop():
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+# bcrypt is deliberately slow (~100ms); integration tests reuse a handful of passwords.
+# Defined at module scope so the caches live for the whole session.
+_cached_hash_password = functools.lru_cache(maxsize=128)(security.hash_password)
+_cached_verify_password = functools.lru_cache(maxsize=128)(security.verify_password)
 
 
-@pytest_asyncio.fixture(autouse=True)
-async def setup_db():
+async def _cached_ahash_password(password: str) -> str:
+    return _cached_hash_password(password)
+
+
+async def _cached_averify_password(plain_password: str, hashed_password: str) -> bool:
+    return _cached_verify_password(plain_password, hashed_password)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def memoize_password_hashing():
+    # Patch only the endpoint module's bindings; unit tests still exercise real bcrypt
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(auth_endpoints, "ahash_password", _cached_ahash_password)
+        mp.setattr(auth_endpoints, "averify_password", _cached_averify_password)
+        yield
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session", autouse=True)
+async def create_schema():
     async with engine_test.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield
-    async with engine_test.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
+    await engine_test.dispose()
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(autouse=True)
+async def db_transaction(create_schema):
+    global _test_connection
+    async with engine_test.connect() as conn:
+        trans = await conn.begin()
+        _test_connection = conn
+        try:
+            yield conn
+        finally:
+            _test_connection = None
+            await trans.rollback()
+
+
+# In-process ASGI transport: no sockets or connection pool, so one instance serves every client
+asgi_transport = ASGITransport(app=app)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def client() -> AsyncGenerator[AsyncClient, None]:
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as c:
+    # One client for the whole run; per-test isolation comes from db_transaction
+    async with AsyncClient(transport=asgi_transport, base_url="http://test") as c:
         yield c
 
 
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def shared_user(create_schema, client: AsyncClient) -> dict:
+    """A user registered once per run, for tests that only read it.
+
+    The registration is committed outside the per-test transactions so it survives
+    their rollbacks; tests that create or modify users should register their own.
+    """
+    global _test_connection
+    user = {"email": "shared@example.com", "password": "testpassword123", "full_name": "Shared User"}
+    async with engine_test.begin() as conn:
+        _test_connection = conn
+        try:
+            response = await client.post("/api/v1/auth/register", json=user)
+        finally:
+            _test_connection = None
+    assert response.status_code == 201
+    return {**user, "token": response.json()["access_token"]}
+
+
 @pytest_asyncio.fixture
 async def db_session() -> AsyncGenerator[AsyncSession, None]:
-    async with async_session_test() as session:
+    async with _session_factory()() as session:
         yield session
@@ -3,6 +3,7 @@ from httpx import AsyncClient
 
 
 @pytest.mark.asyncio
+@pytest.mark.xdist_group("auth")
 class TestAuthEndpoints:
     async def test_register(self, client: AsyncClient):
         response = await client.post(
@@ -24,46 +25,30 @@ class TestAuthEndpoints:
         response = await client.post("/api/v1/auth/register", json=payload)
         assert response.status_code == 409
 
-    async def test_login_success(self, client: AsyncClient):
-        # Register first
-        await client.post(
-            "/api/v1/auth/register",
-            json={"email": "login@example.com", "password": "testpassword123"},
-        )
-        # Login
+    async def test_login_success(self, client: AsyncClient, shared_user: dict):
         response = await client.post(
             "/api/v1/auth/login",
-            json={"email": "login@example.com", "password": "testpassword123"},
+            json={"email": shared_user["email"], "password": shared_user["password"]},
         )
         assert response.status_code == 200
         assert "access_token" in response.json()
 
-    async def test_login_wrong_password(self, client: AsyncClient):
-        await client.post(
-            "/api/v1/auth/register",
-            json={"email": "wrong@example.com", "password": "correctpassword"},
-        )
+    async def test_login_wrong_password(self, client: AsyncClient, shared_user: dict):
         response = await client.post(
             "/api/v1/auth/login",
-            json={"email": "wrong@example.com", "password": "wrongpassword"},
+            json={"email": shared_user["email"], "password": "wrongpassword"},
         )
         assert response.status_code == 401
 
-    async def test_get_profile(self, client: AsyncClient):
-        reg_resp = await client.post(
-            "/api/v1/auth/register",
-            json={"email": "profile@example.com", "password": "testpassword123", "full_name": "Profile User"},
-        )
-        token = reg_resp.json()["access_token"]
-
+    async def test_get_profile(self, client: AsyncClient, shared_user: dict):
         response = await client.get(
             "/api/v1/auth/me",
-            headers={"Authorization": f"Bearer {token}"},
+            headers={"Authorization": f"Bearer {shared_user['token']}"},
         )
         assert response.status_code == 200
         data = response.json()
-        assert data["email"] == "profile@example.com"
-        assert data["full_name"] == "Profile User"
+        assert data["email"] == shared_user["email"]
+        assert data["full_name"] == shared_user["full_name"]
 
     async def test_profile_no_auth(self, client: AsyncClient):
         response = await client.get("/api/v1/auth/me")
@@ -4,34 +4,23 @@ import pytest
 from httpx import AsyncClient
 
 
-@pytest.mark.asyncio
-class TestSessionEndpoints:
-    async def test_share_nonexistent_session(self, client: AsyncClient):
-        response = await client.post(
-            "/api/v1/sessions/00000000-0000-0000-0000-000000000000/share"
-        )
-        assert response.status_code == 404
-
-    async def test_unshare_nonexistent_session(self, client: AsyncClient):
-        response = await client.post(
-            "/api/v1/sessions/00000000-0000-0000-0000-000000000000/unshare"
-        )
-        assert response.status_code == 404
+MISSING_SESSION_URL = "/api/v1/sessions/00000000-0000-0000-0000-000000000000"
 
-    async def test_export_nonexistent_session(self, client: AsyncClient):
-        response = await client.get(
-            "/api/v1/sessions/00000000-0000-0000-0000-000000000000/export/markdown"
-        )
-        assert response.status_code == 404
-
-    async def test_delete_nonexistent_session(self, client: AsyncClient):
-        response = await client.delete(
-            "/api/v1/sessions/00000000-0000-0000-0000-000000000000"
-        )
-        assert response.status_code == 404
 
-    async def test_get_shared_with_invalid_token(self, client: AsyncClient):
-        response = await client.get("/api/v1/sessions/shared/nonexistent-token")
+@pytest.mark.asyncio
+class TestSessionEndpoints:
+    @pytest.mark.parametrize(
+        ("method", "url"),
+        [
+            pytest.param("POST", f"{MISSING_SESSION_URL}/share", id="share"),
+            pytest.param("POST", f"{MISSING_SESSION_URL}/unshare", id="unshare"),
+            pytest.param("GET", f"{MISSING_SESSION_URL}/export/markdown", id="export"),
+            pytest.param("DELETE", MISSING_SESSION_URL, id="delete"),
+            pytest.param("GET", "/api/v1/sessions/shared/nonexistent-token", id="shared-invalid-token"),
+        ],
+    )
+    async def test_nonexistent_session_returns_404(self, client: AsyncClient, method: str, url: str):
+        response = await client.request(method, url)
         assert response.status_code == 404
 
 
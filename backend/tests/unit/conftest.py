@@ -0,0 +1,30 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import anthropic
+import pytest
+
+from app.services.rag import _get_anthropic_client
+
+
+class FakeAnthropic:
+    """Stand-in for anthropic.AsyncAnthropic: no HTTP client, SSL context or network."""
+
+    def __init__(self, *args, **kwargs):
+        self.messages = SimpleNamespace(
+            create=AsyncMock(return_value=SimpleNamespace(content=[SimpleNamespace(text="")]))
+        )
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture(scope="package", autouse=True)
+def fake_anthropic():
+    # Agents and RAGService build their client via anthropic.AsyncAnthropic at call time
+    # Drop any real client cached earlier, and don't leak the fake one afterwards
+    _get_anthropic_client.cache_clear()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(anthropic, "AsyncAnthropic", FakeAnthropic)
+        yield FakeAnthropic
+    _get_anthropic_client.cache_clear()
@@ -1,10 +1,21 @@
 """Tests for multi-agent pipeline components — state, strategies, fusion, orchestrator logic."""
 
+import copy
+
 import pytest
+from app.agents import retrieval_agent as retrieval_module
 from app.agents.state import AgentState
 from app.agents.retrieval_agent import RetrievalAgent
 
 
+@pytest.fixture(params=["numpy", "python"])
+def fusion_backend(request, monkeypatch):
+    """Run a test against both fusion paths; Vercel installs no numpy and runs the loop."""
+    if request.param == "python":
+        monkeypatch.setattr(retrieval_module, "np", None)
+    return request.param
+
+
 class TestAgentState:
     def test_default_state(self):
         state = AgentState()
@@ -65,6 +76,7 @@ class TestRetrievalStrategy:
         assert RetrievalAgent._select_strategy("meaning of backpropagation in deep learning") == "sparse"
 
 
+@pytest.mark.usefixtures("fusion_backend")
 class TestRankFusion:
     def test_combined_scoring(self):
         chunks = [
@@ -106,6 +118,29 @@ class TestRankFusion:
         # max sparse contribution = 1.0 * 0.4 = 0.4
         assert ranked[0]["combined_score"] == pytest.approx(0.4)
 
+    def test_ties_keep_input_order(self):
+        chunks = [
+            {"content": "First", "dense_score": 0.5},
+            {"content": "Top", "dense_score": 0.9},
+            {"content": "Second", "dense_score": 0.5},
+            {"content": "Third", "dense_score": 0.5, "sparse_score": 0.0},
+        ]
+        ranked = RetrievalAgent._rank_fusion(chunks)
+        assert [c["content"] for c in ranked] == ["Top", "First", "Second", "Third"]
+
+
+def test_rank_fusion_numpy_and_python_paths_agree(monkeypatch):
+    # Ties, missing scores, capped sparse scores and zeros, in no particular order
+    chunks = [
+        {"content": f"c{i}", "dense_score": (i * 7 % 5) / 5, "sparse_score": float(i * 3 % 40)}
+        for i in range(60)
+    ]
+    chunks += [{"content": "dense-only", "dense_score": 0.4}, {"content": "none"}]
+    with_numpy = RetrievalAgent._rank_fusion(copy.deepcopy(chunks))
+    monkeypatch.setattr(retrieval_module, "np", None)
+    without_numpy = RetrievalAgent._rank_fusion(chunks)
+    assert with_numpy == without_numpy
+
 
 class TestSynthesisAgentNoChunks:
     """Test SynthesisAgent behavior with empty chunks (no API call needed)."""
@@ -1,54 +1,137 @@
+import copy
+import math
+from collections import Counter
+
 import pytest
-from app.services.bm25_search import BM25SearchService
+from app.services import bm25_search
+from app.services.bm25_search import B, EPSILON, K1, BM25SearchService
 
 
-class TestBM25Search:
-    def setup_method(self):
-        self.bm25 = BM25SearchService()
-        self.chunks = [
-            {"content": "Machine learning is a subset of artificial intelligence.", "document_id": "doc1", "chunk_index": 0},
-            {"content": "Deep learning uses neural networks with many layers.", "document_id": "doc1", "chunk_index": 1},
-            {"content": "Python is a popular programming language for data science.", "document_id": "doc2", "chunk_index": 0},
-            {"content": "Natural language processing helps computers understand text.", "document_id": "doc2", "chunk_index": 1},
-        ]
-        self.bm25.build_index("test-ns", self.chunks)
+CHUNKS = [
+    {"content": "Machine learning is a subset of artificial intelligence.", "document_id": "doc1", "chunk_index": 0},
+    {"content": "Deep learning uses neural networks with many layers.", "document_id": "doc1", "chunk_index": 1},
+    {"content": "Python is a popular programming language for data science.", "document_id": "doc2", "chunk_index": 0},
+    {"content": "Natural language processing helps computers understand text.", "document_id": "doc2", "chunk_index": 1},
+]
+
+
+# Every text repeats, so scores tie exactly, including across the top_k cut
+TIED_TEXTS = (
+    "vector search ranks chunks",
+    "keyword search matches terms",
+    "hybrid search fuses vector and keyword results",
+    "chunks are stored with metadata",
+)
+TIED_CHUNKS = [
+    {"content": TIED_TEXTS[i % len(TIED_TEXTS)], "document_id": f"doc{i}", "chunk_index": 0}
+    for i in range(20)
+]
+
+
+def _reference_scores(corpus: list[list[str]], query: list[str]) -> list[float]:
+    """Plain-Python Okapi BM25, following rank_bm25.BM25Okapi.get_scores."""
+    n_docs = len(corpus)
+    avgdl = sum(len(doc) for doc in corpus) / n_docs
+    df = Counter(term for doc in corpus for term in set(doc))
+    idf = {t: math.log(n_docs - f + 0.5) - math.log(f + 0.5) for t, f in df.items()}
+    floor = EPSILON * sum(idf.values()) / len(idf)
+    idf = {t: floor if v < 0 else v for t, v in idf.items()}
+    scores = []
+    for doc in corpus:
+        tf = Counter(doc)
+        scores.append(sum(
+            idf.get(q, 0.0) * tf[q] * (K1 + 1)
+            / (tf[q] + K1 * (1 - B + B * len(doc) / avgdl))
+            for q in query
+        ))
+    return scores
+
+
+@pytest.fixture(scope="module")
+def tied_bm25():
+    service = BM25SearchService()
+    service.build_index("tied", TIED_CHUNKS)
+    return service
+
+
+@pytest.fixture(scope="module")
+def bm25():
+    service = BM25SearchService()
+    service.build_index("test-ns", CHUNKS)
+    return service
 
-    def test_basic_search(self):
-        results = self.bm25.search("machine learning", "test-ns", top_k=2)
+
+@pytest.fixture
+def mutable_bm25(bm25):
+    """Private copy of the shared index for tests that modify it."""
+    return copy.deepcopy(bm25)
+
+
+class TestBM25Search:
+    def test_basic_search(self, bm25):
+        results = bm25.search("machine learning", "test-ns", top_k=2)
         assert len(results) > 0
-        assert results[0]["content"] == self.chunks[0]["content"]
+        assert results[0]["content"] == CHUNKS[0]["content"]
 
-    def test_search_returns_scores(self):
-        results = self.bm25.search("neural networks", "test-ns")
+    def test_search_returns_scores(self, bm25):
+        results = bm25.search("neural networks", "test-ns")
         for r in results:
             assert "bm25_score" in r
             assert r["bm25_score"] > 0
 
-    def test_search_empty_namespace(self):
-        results = self.bm25.search("test", "nonexistent-ns")
+    def test_search_empty_namespace(self, bm25):
+        results = bm25.search("test", "nonexistent-ns")
         assert results == []
 
-    def test_filter_by_document(self):
-        results = self.bm25.search(
+    def test_filter_by_document(self, bm25):
+        results = bm25.search(
             "learning", "test-ns", filter_document_ids=["doc2"]
         )
         for r in results:
             assert r["document_id"] == "doc2"
 
-    def test_top_k_limit(self):
-        results = self.bm25.search("learning", "test-ns", top_k=1)
+    def test_top_k_limit(self, bm25):
+        results = bm25.search("learning", "test-ns", top_k=1)
         assert len(results) <= 1
 
-    def test_remove_document(self):
-        self.bm25.remove_document("test-ns", "doc1")
-        results = self.bm25.search("machine learning", "test-ns")
+    def test_remove_document(self, mutable_bm25):
+        mutable_bm25.remove_document("test-ns", "doc1")
+        results = mutable_bm25.search("machine learning", "test-ns")
         for r in results:
             assert r["document_id"] != "doc1"
 
-    def test_add_to_index(self):
+    def test_add_to_index(self, mutable_bm25):
         new_chunks = [
             {"content": "Reinforcement learning trains agents via rewards.", "document_id": "doc3", "chunk_index": 0}
         ]
-        self.bm25.add_to_index("test-ns", new_chunks)
-        results = self.bm25.search("reinforcement rewards", "test-ns")
+        mutable_bm25.add_to_index("test-ns", new_chunks)
+        results = mutable_bm25.search("reinforcement rewards", "test-ns")
         assert any(r["document_id"] == "doc3" for r in results)
+
+
+class TestBM25Equivalence:
+    @pytest.mark.parametrize("top_k", [1, 3, 5, 7, 12, 50])
+    @pytest.mark.parametrize("query", ["vector search", "keyword search chunks", "search"])
+    def test_matches_reference_scores_and_order(self, tied_bm25, query, top_k):
+        corpus = [BM25SearchService._tokenize(c["content"]) for c in TIED_CHUNKS]
+        reference = _reference_scores(corpus, BM25SearchService._tokenize(query))
+        # Stable sort: score descending, ties in corpus order
+        expected = sorted(
+            (i for i, score in enumerate(reference) if score > 0),
+            key=lambda i: -reference[i],
+        )[:top_k]
+
+        results = tied_bm25.search(query, "tied", top_k=top_k)
+
+        assert [r["document_id"] for r in results] == [f"doc{i}" for i in expected]
+        assert [r["bm25_score"] for r in results] == pytest.approx(
+            [reference[i] for i in expected], rel=1e-12
+        )
+
+    @pytest.mark.parametrize("query", ["vector search", "keyword search chunks"])
+    def test_numba_kernel_matches_numpy_path(self, tied_bm25, monkeypatch, query):
+        pytest.importorskip("numba")
+        jitted = tied_bm25.search(query, "tied", top_k=50)
+        monkeypatch.setattr(bm25_search, "numba", None)
+        fallback = tied_bm25.search(query, "tied", top_k=50)
+        assert jitted == fallback
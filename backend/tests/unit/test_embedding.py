@@ -0,0 +1,48 @@
+"""Tests for the embedding service — content-hash embedding cache."""
+
+import numpy as np
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+from app.models.document import ChunkEmbedding
+from app.services.embedding import EmbeddingService
+
+
+class FakeModel:
+    def __init__(self):
+        self.encoded: list[str] = []
+
+    def encode(self, texts, normalize_embeddings=True, show_progress_bar=False):
+        self.encoded.extend(texts)
+        return np.array([[float(len(t)), 1.0, 0.0] for t in texts], dtype=np.float32)
+
+
+class TestEmbeddingCache:
+    def setup_method(self):
+        self.engine = create_engine("sqlite://")
+        ChunkEmbedding.__table__.create(self.engine)
+        self.service = EmbeddingService()
+        self.service._model = FakeModel()
+
+    def test_without_session_encodes_everything(self):
+        result = self.service.embed_texts(["a", "a"])
+        assert len(result) == 2
+        assert self.service.model.encoded == ["a", "a"]
+
+    def test_duplicates_encoded_once(self):
+        with Session(self.engine) as db:
+            result = self.service.embed_texts(["footer", "body", "footer"], db=db)
+        assert self.service.model.encoded == ["footer", "body"]
+        assert result[0] == result[2] == [6.0, 1.0, 0.0]
+
+    def test_cached_vectors_reused(self):
+        with Session(self.engine) as db:
+            self.service.embed_texts(["first", "second"], db=db)
+            db.commit()
+        with Session(self.engine) as db:
+            result = self.service.embed_texts(["second", "third"], db=db)
+            db.commit()
+            count = db.execute(select(func.count()).select_from(ChunkEmbedding)).scalar()
+        assert self.service.model.encoded == ["first", "second", "third"]
+        assert result == [[6.0, 1.0, 0.0], [5.0, 1.0, 0.0]]
+        assert count == 3
@@ -2,10 +2,21 @@
 
 import pytest
 import time
-from unittest.mock import AsyncMock, MagicMock
+from collections import deque, namedtuple
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 from app.middleware.rate_limit import RateLimitMiddleware
 
+# Plain stand-ins: the middleware only reads request.client.host and returns the response
+_FakeRequest = namedtuple("_FakeRequest", "client")
+_FakeClient = namedtuple("_FakeClient", "host")
+_OK_RESPONSE = SimpleNamespace(status_code=200)
+
+
+async def _ok(_request):
+    return _OK_RESPONSE
+
 
 class TestRateLimitMiddleware:
     def setup_method(self):
@@ -13,19 +24,15 @@ class TestRateLimitMiddleware:
         self.middleware = RateLimitMiddleware(self.app, requests_per_minute=5)
 
     def _make_request(self, ip: str = "127.0.0.1"):
-        request = MagicMock()
-        request.client = MagicMock()
-        request.client.host = ip
-        return request
+        return _FakeRequest(_FakeClient(ip))
 
     @pytest.mark.asyncio
     async def test_allows_requests_under_limit(self):
         request = self._make_request()
-        call_next = AsyncMock(return_value=MagicMock(status_code=200))
 
         # Should allow 5 requests
         for _ in range(5):
-            response = await self.middleware.dispatch(request, call_next)
+            response = await self.middleware.dispatch(request, _ok)
             assert response.status_code == 200
 
     @pytest.mark.asyncio
@@ -33,48 +40,43 @@ class TestRateLimitMiddleware:
         from fastapi import HTTPException
 
         request = self._make_request()
-        call_next = AsyncMock(return_value=MagicMock(status_code=200))
 
         # Fill up the limit
         for _ in range(5):
-            await self.middleware.dispatch(request, call_next)
+            await self.middleware.dispatch(request, _ok)
 
         # 6th request should be blocked
         with pytest.raises(HTTPException) as exc_info:
-            await self.middleware.dispatch(request, call_next)
+            await self.middleware.dispatch(request, _ok)
         assert exc_info.value.status_code == 429
 
     @pytest.mark.asyncio
     async def test_different_ips_independent(self):
-        call_next = AsyncMock(return_value=MagicMock(status_code=200))
-
         # Fill up limit for IP 1
         for _ in range(5):
-            await self.middleware.dispatch(self._make_request("1.1.1.1"), call_next)
+            await self.middleware.dispatch(self._make_request("1.1.1.1"), _ok)
 
         # IP 2 should still be allowed
-        response = await self.middleware.dispatch(self._make_request("2.2.2.2"), call_next)
+        response = await self.middleware.dispatch(self._make_request("2.2.2.2"), _ok)
         assert response.status_code == 200
 
     @pytest.mark.asyncio
     async def test_window_cleanup(self):
         request = self._make_request()
-        call_next = AsyncMock(return_value=MagicMock(status_code=200))
 
         # Inject old timestamps (> 60 seconds ago)
-        old_time = time.time() - 120
-        self.middleware._requests["127.0.0.1"] = [old_time] * 10
+        old_time = time.monotonic_ns() - 120_000_000_000
+        self.middleware._requests["127.0.0.1"] = deque([old_time] * 10)
 
         # Should still allow because old entries get cleaned
-        response = await self.middleware.dispatch(request, call_next)
+        response = await self.middleware.dispatch(request, _ok)
         assert response.status_code == 200
+        assert len(self.middleware._requests["127.0.0.1"]) == 1
 
     @pytest.mark.asyncio
     async def test_no_client_uses_unknown(self):
-        request = MagicMock()
-        request.client = None
-        call_next = AsyncMock(return_value=MagicMock(status_code=200))
+        request = _FakeRequest(None)
 
-        response = await self.middleware.dispatch(request, call_next)
+        response = await self.middleware.dispatch(request, _ok)
         assert response.status_code == 200
         assert "unknown" in self.middleware._requests
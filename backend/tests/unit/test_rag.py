@@ -1,61 +1,179 @@
 """Tests for the RAG service — hybrid search, RRF, context building, message building."""
 
+import copy
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
-from app.services.rag import RAGService
+from app.services import rag as rag_module
+from app.services.rag import _RRF_MAX_RANK, RRF_K, RAGService, settings
+
+
+@pytest.fixture(scope="module")
+def dense_hits() -> tuple[dict, ...]:
+    return tuple(
+        {"vector_id": f"d{i}", "content": f"Dense result {i}", "score": 0.9 - i * 0.05}
+        for i in range(10)
+    )
+
+
+@pytest.fixture(scope="module")
+def sparse_hits() -> tuple[dict, ...]:
+    return tuple(
+        {"document_id": "doc1", "chunk_index": i, "content": f"Sparse result {i}", "bm25_score": 5.0 - i}
+        for i in range(4)
+    )
+
+
+@pytest.fixture(params=["numpy", "python"])
+def rrf_backend(request, monkeypatch):
+    """Run a test against both fusion paths; Vercel installs no numpy and runs the loop."""
+    if request.param == "python":
+        monkeypatch.setattr(rag_module, "np", None)
+    return request.param
+
+
+def _reference_rrf(dense: list[dict], sparse: list[dict], top_k: int, k: int) -> list[tuple]:
+    """Textbook RRF: accumulate per key in first-seen order, stable sort by score."""
+    scores: dict[str, float] = {}
+    for rows in (
+        [rag_module._as_rrf_row_dense(rank, item) for rank, item in enumerate(dense)],
+        [rag_module._as_rrf_row_sparse(rank, item) for rank, item in enumerate(sparse)],
+    ):
+        for rank, (key, _) in enumerate(rows, 1):
+            scores[key] = scores.get(key, 0.0) + 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda kv: -kv[1])[:top_k]
+
+
+def _fused_keys(results: list[dict]) -> list[tuple]:
+    return [
+        (r.get("vector_id") or f"{r.get('document_id')}_{r.get('chunk_index')}", r["rrf_score"])
+        for r in results
+    ]
 
 
+def _rrf_inputs(n_dense: int, n_sparse: int, n_shared: int) -> tuple[list[dict], list[dict]]:
+    # Same rank in both lists gives exact score ties; the first n_shared BM25 hits are
+    # chunks that dense search also found (vector ids match the BM25 fusion key)
+    dense = [{"vector_id": f"doc0_{i}"} for i in range(n_dense)]
+    sparse = [
+        {"document_id": "doc0" if i < n_shared else "doc1", "chunk_index": i}
+        for i in range(n_sparse)
+    ]
+    return dense, sparse
+
+
+@pytest.mark.usefixtures("rrf_backend")
 class TestReciprocalRankFusion:
-    def test_rrf_combines_results(self):
-        dense = [
-            {"vector_id": "a", "content": "Dense result A", "score": 0.9},
-            {"vector_id": "b", "content": "Dense result B", "score": 0.7},
-        ]
-        sparse = [
-            {"document_id": "doc1", "chunk_index": 0, "content": "Sparse result C", "bm25_score": 5.0},
-            {"document_id": "doc1", "chunk_index": 1, "content": "Same as B", "bm25_score": 3.0},
-        ]
+    # Fusion only (re)writes rrf_score on the hits, so the shared fixtures stay valid
+    @pytest.mark.parametrize(
+        ("n_dense", "n_sparse", "top_k", "expected"),
+        [
+            pytest.param(0, 0, 5, 0, id="empty"),
+            pytest.param(1, 0, 5, 1, id="dense-only"),
+            pytest.param(0, 1, 5, 1, id="sparse-only"),
+            pytest.param(2, 2, 5, 4, id="combined"),
+            pytest.param(10, 0, 3, 3, id="respects-top-k"),
+        ],
+    )
+    def test_rrf_result_count(self, dense_hits, sparse_hits, n_dense, n_sparse, top_k, expected):
+        results = RAGService._reciprocal_rank_fusion(
+            list(dense_hits[:n_dense]), list(sparse_hits[:n_sparse]), top_k=top_k
+        )
+        assert len(results) == expected
+
+    @pytest.mark.parametrize(("n_dense", "n_sparse"), [(3, 0), (2, 2), (10, 4)])
+    def test_rrf_scores_positive_and_decreasing(self, dense_hits, sparse_hits, n_dense, n_sparse):
+        results = RAGService._reciprocal_rank_fusion(
+            list(dense_hits[:n_dense]), list(sparse_hits[:n_sparse]), top_k=10
+        )
+        scores = [r["rrf_score"] for r in results]
+        assert all(score > 0 for score in scores)
+        assert scores == sorted(scores, reverse=True)
+
+    @pytest.mark.parametrize("k", [RRF_K, 10])
+    @pytest.mark.parametrize(
+        ("n_dense", "n_sparse", "n_shared", "top_k"),
+        [
+            pytest.param(6, 6, 0, 5, id="ties-at-cut"),
+            pytest.param(8, 5, 3, 4, id="overlap"),
+            pytest.param(8, 5, 3, 50, id="all-candidates"),
+            pytest.param(7, 0, 0, 3, id="dense-only"),
+            pytest.param(_RRF_MAX_RANK + 5, 3, 2, 10, id="beyond-table"),
+            pytest.param(_RRF_MAX_RANK + 5, 0, 0, _RRF_MAX_RANK + 5, id="single-beyond-table"),
+        ],
+    )
+    def test_rrf_matches_reference(self, n_dense, n_sparse, n_shared, top_k, k):
+        dense, sparse = _rrf_inputs(n_dense, n_sparse, n_shared)
+        expected = _reference_rrf(dense, sparse, top_k, k)
+        results = RAGService._reciprocal_rank_fusion(dense, sparse, top_k=top_k, k=k)
+        # Exact: every path adds the same float64 terms in the same order
+        assert _fused_keys(results) == expected
+
+    def test_rrf_keeps_dense_payload_for_shared_chunk(self):
+        dense, sparse = _rrf_inputs(2, 2, 1)
         results = RAGService._reciprocal_rank_fusion(dense, sparse, top_k=5)
-        assert len(results) >= 2
-        for r in results:
-            assert "rrf_score" in r
-            assert r["rrf_score"] > 0
-
-    def test_rrf_respects_top_k(self):
-        dense = [
-            {"vector_id": f"d{i}", "content": f"Result {i}", "score": 0.5}
-            for i in range(10)
-        ]
-        results = RAGService._reciprocal_rank_fusion(dense, [], top_k=3)
-        assert len(results) == 3
+        assert results[0] is dense[0]
 
-    def test_rrf_empty_inputs(self):
-        results = RAGService._reciprocal_rank_fusion([], [], top_k=5)
-        assert results == []
 
-    def test_rrf_dense_only(self):
-        dense = [
-            {"vector_id": "x", "content": "Only dense", "score": 0.95},
-        ]
-        results = RAGService._reciprocal_rank_fusion(dense, [], top_k=5)
-        assert len(results) == 1
-        assert results[0]["rrf_score"] > 0
+@pytest.mark.parametrize("k", [RRF_K, 10])
+@pytest.mark.parametrize(("n_dense", "n_sparse", "top_k"), [(6, 6, 5), (_RRF_MAX_RANK + 5, 40, 25)])
+def test_rrf_numpy_and_python_paths_agree(monkeypatch, n_dense, n_sparse, top_k, k):
+    dense, sparse = _rrf_inputs(n_dense, n_sparse, n_sparse // 2)
+    with_numpy = RAGService._reciprocal_rank_fusion(
+        copy.deepcopy(dense), copy.deepcopy(sparse), top_k=top_k, k=k
+    )
+    monkeypatch.setattr(rag_module, "np", None)
+    without_numpy = RAGService._reciprocal_rank_fusion(dense, sparse, top_k=top_k, k=k)
+    assert with_numpy == without_numpy
 
-    def test_rrf_sparse_only(self):
-        sparse = [
-            {"document_id": "doc1", "chunk_index": 0, "content": "Only sparse", "bm25_score": 4.0},
-        ]
-        results = RAGService._reciprocal_rank_fusion([], sparse, top_k=5)
-        assert len(results) == 1
-
-    def test_rrf_scores_decrease_with_rank(self):
-        dense = [
-            {"vector_id": "a", "content": "First", "score": 0.9},
-            {"vector_id": "b", "content": "Second", "score": 0.8},
-            {"vector_id": "c", "content": "Third", "score": 0.7},
+
+class TestHybridSearch:
+    @pytest.mark.asyncio
+    async def test_native_hybrid_skips_bm25(self):
+        vector_store = MagicMock()
+        vector_store.supports_sparse.return_value = True
+        vector_store.search = AsyncMock(return_value=[{"vector_id": "a", "score": 0.9}])
+        bm25 = MagicMock()
+        rag = RAGService(vector_store=vector_store, bm25_service=bm25)
+
+        results = await rag._hybrid_search("query", uuid.uuid4(), top_k=5)
+
+        assert results == [{"vector_id": "a", "score": 0.9}]
+        assert vector_store.search.await_args.kwargs["hybrid"] is True
+        bm25.search.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_rrf_without_sparse_index(self):
+        # e.g. PINECONE_HYBRID on against an existing cosine index
+        vector_store = MagicMock()
+        vector_store.supports_sparse.return_value = False
+        vector_store.search = AsyncMock(return_value=[{"vector_id": "a", "score": 0.9}])
+        bm25 = MagicMock()
+        bm25.search.return_value = [{"document_id": "doc1", "chunk_index": 0, "bm25_score": 1.0}]
+        rag = RAGService(vector_store=vector_store, bm25_service=bm25)
+
+        results = await rag._hybrid_search("query", uuid.uuid4(), top_k=5)
+
+        assert "hybrid" not in vector_store.search.await_args.kwargs
+        bm25.search.assert_called_once()
+        assert len(results) == 2
+
+
+class TestDedupeContexts:
+    def test_drops_duplicate_chunks(self):
+        contexts = [
+            {"vector_id": "doc1_0", "document_id": "doc1", "chunk_index": 0, "rrf_score": 0.03},
+            {"document_id": "doc1", "chunk_index": 1},
+            {"document_id": "doc1", "chunk_index": 0, "bm25_score": 2.0},
         ]
-        results = RAGService._reciprocal_rank_fusion(dense, [], top_k=3)
-        scores = [r["rrf_score"] for r in results]
-        assert scores == sorted(scores, reverse=True)
+        unique = RAGService._dedupe_contexts(contexts)
+        assert [c["chunk_index"] for c in unique] == [0, 1]
+        assert unique[0]["vector_id"] == "doc1_0"
+
+    def test_keeps_contexts_without_chunk_key(self):
+        contexts = [{"content": "a"}, {"content": "b"}]
+        assert len(RAGService._dedupe_contexts(contexts)) == 2
 
 
 class TestBuildContext:
@@ -111,6 +229,42 @@ class TestBuildMessages:
         assert len(messages) == 11
 
 
+class TestGenerationPrompt:
+    CONTEXTS = [
+        {"document_id": "doc2", "chunk_index": 0, "content": "Second doc"},
+        {"document_id": "doc1", "chunk_index": 3, "content": "First doc"},
+    ]
+
+    def test_uncached_keeps_excerpts_in_user_turn(self, monkeypatch):
+        monkeypatch.setattr(settings, "anthropic_prompt_cache", False)
+        prompt = RAGService._generation_prompt("What?", [dict(c) for c in self.CONTEXTS])
+        assert prompt["system"] == RAGService._system_prompt()
+        assert "Second doc" in prompt["messages"][-1]["content"]
+
+    def test_cached_prefix_is_question_independent(self, monkeypatch):
+        monkeypatch.setattr(settings, "anthropic_prompt_cache", True)
+        contexts = [dict(c) for c in self.CONTEXTS]
+        first = RAGService._generation_prompt("What?", contexts)
+        second = RAGService._generation_prompt(
+            "And why?", list(reversed(contexts)), [{"role": "user", "content": "Hi"}]
+        )
+        assert first["system"] == second["system"]
+        assert first["system"][-1]["cache_control"] == {"type": "ephemeral"}
+        # The caller's list keeps relevance order
+        assert [c["document_id"] for c in contexts] == ["doc2", "doc1"]
+        assert "Second doc" not in first["messages"][-1]["content"]
+        assert "And why?" in second["messages"][-1]["content"]
+
+    def test_cached_sources_keep_relevance_order_with_prompt_labels(self, monkeypatch):
+        monkeypatch.setattr(settings, "anthropic_prompt_cache", True)
+        contexts = [dict(c) for c in self.CONTEXTS]
+        excerpts = RAGService._generation_prompt("What?", contexts)["system"][-1]["text"]
+        sources = RAGService._extract_sources(contexts)
+        assert [s["document_id"] for s in sources] == ["doc2", "doc1"]
+        assert [s["source_index"] for s in sources] == [2, 1]
+        assert excerpts.index("[Source 1] (Document: doc1") < excerpts.index("[Source 2]")
+
+
 class TestExtractSources:
     def test_extracts_source_info(self):
         contexts = [
@@ -0,0 +1,212 @@
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from app.services import rag as rag_module
+from app.services import rag_cache as rag_cache_module
+from app.services.rag import RAGService
+from app.services.rag_cache import RAGResponseCache
+
+OWNER = uuid.UUID("00000000-0000-0000-0000-000000000001")
+OTHER_OWNER = uuid.UUID("00000000-0000-0000-0000-000000000002")
+
+
+def _response(*document_ids: str) -> dict:
+    return {
+        "content": "Answer",
+        "sources": [{"source_index": i + 1, "document_id": d} for i, d in enumerate(document_ids)],
+    }
+
+
+class TestRAGResponseCache:
+    def test_hit_after_set(self):
+        cache = RAGResponseCache()
+        key = cache.make_key("What is AI?", OWNER)
+        assert cache.get(key) is None
+        cache.set(key, OWNER, _response("doc1"))
+        assert cache.get(key)["content"] == "Answer"
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_hit_returns_independent_sources(self):
+        cache = RAGResponseCache()
+        key = cache.make_key("What is AI?", OWNER)
+        response = _response("doc1")
+        cache.set(key, OWNER, response)
+        response["sources"].append({"source_index": 2, "document_id": "doc2"})
+        hit = cache.get(key)
+        hit["sources"][0]["document_id"] = "changed"
+        assert cache.get(key)["sources"] == [{"source_index": 1, "document_id": "doc1"}]
+
+    def test_key_normalizes_question(self):
+        assert RAGResponseCache.make_key("What  is AI?", OWNER) == RAGResponseCache.make_key(
+            " what is ai? ", OWNER
+        )
+
+    def test_key_separates_owner_filter_and_history(self):
+        base = RAGResponseCache.make_key("What is AI?", OWNER)
+        assert base != RAGResponseCache.make_key("What is AI?", OTHER_OWNER)
+        assert base != RAGResponseCache.make_key("What is AI?", OWNER, [uuid.uuid4()])
+        assert base != RAGResponseCache.make_key(
+            "What is AI?", OWNER, chat_history=[{"role": "user", "content": "Hi"}]
+        )
+
+    def test_expired_entry_is_a_miss(self, monkeypatch):
+        cache = RAGResponseCache(ttl_seconds=10)
+        key = cache.make_key("q", OWNER)
+        cache.set(key, OWNER, _response())
+        now = rag_cache_module.time.monotonic()
+        monkeypatch.setattr(rag_cache_module.time, "monotonic", lambda: now + 11)
+        assert cache.get(key) is None
+
+    def test_evicts_least_recently_used(self):
+        cache = RAGResponseCache(max_entries=2)
+        keys = [cache.make_key(f"q{i}", OWNER) for i in range(3)]
+        cache.set(keys[0], OWNER, _response())
+        cache.set(keys[1], OWNER, _response())
+        cache.get(keys[0])  # keys[1] is now the oldest
+        cache.set(keys[2], OWNER, _response())
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is not None
+
+    def test_invalidate_document_drops_citing_entries_only(self):
+        cache = RAGResponseCache()
+        citing = cache.make_key("q1", OWNER)
+        unrelated = cache.make_key("q2", OWNER)
+        cache.set(citing, OWNER, _response("doc1", "doc2"))
+        cache.set(unrelated, OWNER, _response("doc3"))
+        assert cache.invalidate_document(OWNER, "doc1") == 1
+        assert cache.get(citing) is None
+        assert cache.get(unrelated) is not None
+
+    def test_invalidate_owner(self):
+        cache = RAGResponseCache()
+        mine = cache.make_key("q", OWNER)
+        theirs = cache.make_key("q", OTHER_OWNER)
+        cache.set(mine, OWNER, _response("doc1"))
+        cache.set(theirs, OTHER_OWNER, _response("doc1"))
+        assert cache.invalidate_owner(OWNER) == 1
+        assert cache.get(theirs) is not None
+
+    @pytest.mark.parametrize(("max_entries", "ttl"), [(0, 300), (1024, 0)])
+    def test_disabled_cache_stores_nothing(self, max_entries, ttl):
+        cache = RAGResponseCache(max_entries=max_entries, ttl_seconds=ttl)
+        key = cache.make_key("q", OWNER)
+        cache.set(key, OWNER, _response())
+        assert cache.get(key) is None
+
+
+class _FakeStream:
+    """Async context manager shaped like ``messages.stream(...)``."""
+
+    def __init__(self, chunks: list[str], fail_after: int | None = None):
+        self.chunks = chunks
+        self.fail_after = fail_after
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    @property
+    async def text_stream(self):
+        for i, chunk in enumerate(self.chunks):
+            if i == self.fail_after:
+                raise RuntimeError("connection dropped")
+            yield chunk
+
+    async def get_final_message(self):
+        return SimpleNamespace(usage=None)
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = RAGResponseCache()
+    monkeypatch.setattr(rag_module, "get_rag_cache", lambda: cache)
+    return cache
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = SimpleNamespace(
+        messages=SimpleNamespace(
+            create=AsyncMock(
+                return_value=SimpleNamespace(content=[SimpleNamespace(text="AI is AI")], usage=None)
+            ),
+            stream=MagicMock(side_effect=lambda **_: _FakeStream(["AI ", "is ", "AI"])),
+        )
+    )
+    monkeypatch.setattr(rag_module, "_get_anthropic_client", lambda: client)
+    return client
+
+
+@pytest.fixture
+def rag():
+    service = RAGService(vector_store=MagicMock(), bm25_service=MagicMock())
+    service._hybrid_search = AsyncMock(
+        return_value=[{"document_id": "doc1", "chunk_index": 0, "content": "AI is AI"}]
+    )
+    return service
+
+
+async def _collect(stream) -> list[dict]:
+    return [event async for event in stream]
+
+
+class TestRAGServiceCaching:
+    @pytest.mark.asyncio
+    async def test_query_hit_skips_retrieval_and_generation(self, rag, cache, client):
+        first = await rag.query("What is AI?", OWNER)
+        second = await rag.query("what is  AI?", OWNER)
+
+        assert rag._hybrid_search.await_count == 1
+        assert client.messages.create.await_count == 1
+        assert second["content"] == first["content"] == "AI is AI"
+        assert second["sources"] == first["sources"]
+        assert second["sources"] is not first["sources"]
+
+    @pytest.mark.asyncio
+    async def test_stream_stores_only_after_completion(self, rag, cache, client):
+        key = cache.make_key("What is AI?", OWNER)
+        events = []
+        async for event in rag.query_stream("What is AI?", OWNER):
+            if event["type"] == "text":
+                assert key not in cache._entries
+            events.append(event)
+
+        assert [e["type"] for e in events][-2:] == ["sources", "done"]
+        assert cache.get(key)["content"] == "AI is AI"
+
+    @pytest.mark.asyncio
+    async def test_stream_hit_replays_events(self, rag, cache, client):
+        first = await _collect(rag.query_stream("What is AI?", OWNER))
+        second = await _collect(rag.query_stream("What is AI?", OWNER))
+
+        assert client.messages.stream.call_count == 1
+        assert rag._hybrid_search.await_count == 1
+        assert second == [
+            {"type": "text", "content": "AI is AI"},
+            {"type": "sources", "sources": first[-2]["sources"]},
+            {"type": "done"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failed_stream_is_not_cached(self, rag, cache, client):
+        client.messages.stream.side_effect = lambda **_: _FakeStream(["AI ", "is "], fail_after=1)
+        with pytest.raises(RuntimeError):
+            await _collect(rag.query_stream("What is AI?", OWNER))
+        assert not cache._entries
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_is_not_consulted(self, rag, client, monkeypatch):
+        cache = RAGResponseCache(ttl_seconds=0)
+        monkeypatch.setattr(rag_module, "get_rag_cache", lambda: cache)
+        monkeypatch.setattr(cache, "make_key", MagicMock())
+
+        await rag.query("What is AI?", OWNER)
+        await _collect(rag.query_stream("What is AI?", OWNER))
+
+        assert rag._hybrid_search.await_count == 2
+        cache.make_key.assert_not_called()
+        assert (cache.hits, cache.misses) == (0, 0)
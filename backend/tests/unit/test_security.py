@@ -1,5 +1,14 @@
 import pytest
-from app.core.security import hash_password, verify_password, create_access_token, decode_access_token
+from app.core.config import get_settings
+from app.core.security import (
+    ahash_password,
+    averify_password,
+    hash_password,
+    pwd_context,
+    verify_password,
+    create_access_token,
+    decode_access_token,
+)
 
 
 class TestSecurity:
@@ -27,3 +36,18 @@ class TestSecurity:
         hash1 = hash_password("password-1")
         hash2 = hash_password("password-2")
         assert hash1 != hash2
+
+    def test_hash_uses_configured_rounds(self):
+        hashed = hash_password("test-password-123")
+        # bcrypt hashes look like $2b$<rounds>$<salt+digest>
+        assert hashed.split("$")[2] == f"{get_settings().bcrypt_rounds:02d}"
+
+    def test_context_uses_configured_rounds(self):
+        assert pwd_context.to_dict()["bcrypt__rounds"] == get_settings().bcrypt_rounds
+        assert verify_password("test-password-123", hash_password("test-password-123"))
+
+    @pytest.mark.asyncio
+    async def test_async_hash_and_verify_password(self):
+        hashed = await ahash_password("test-password-123")
+        assert await averify_password("test-password-123", hashed)
+        assert not await averify_password("wrong-password", hashed)
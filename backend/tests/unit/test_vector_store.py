@@ -0,0 +1,153 @@
+"""Tests for vector store helpers — int8 quantization and sparse-dense payloads."""
+
+import uuid
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from app.services.vector_store import VectorStoreService, quantize_int8, settings
+
+
+class TestQuantizeInt8:
+    def test_values_in_int8_range(self):
+        values, scales = quantize_int8([[0.5, -0.25, 0.1], [0.0, 0.9, -0.9]])
+        for row in values:
+            assert all(-127 <= v <= 127 for v in row)
+        assert max(abs(v) for v in values[0]) == 127
+        assert len(scales) == 2
+
+    def test_preserves_cosine_similarity(self):
+        rng = np.random.default_rng(0)
+        emb = rng.normal(size=(4, 384)).astype(np.float32)
+        values, _ = quantize_int8(emb.tolist())
+        q = np.asarray(values, dtype=np.float32)
+        query = rng.normal(size=384).astype(np.float32)
+
+        def cos(a, b):
+            return a @ b / (np.linalg.norm(a) * np.linalg.norm(b))
+
+        for original, quantized in zip(emb, q):
+            assert abs(cos(original, query) - cos(quantized, query)) < 1e-2
+
+    def test_dequantize_roundtrip(self):
+        values, scales = quantize_int8([[0.3, -0.6, 0.0]])
+        restored = np.asarray(values[0]) * scales[0]
+        np.testing.assert_allclose(restored, [0.3, -0.6, 0.0], atol=0.6 / 127)
+
+    def test_zero_vector(self):
+        values, scales = quantize_int8([[0.0, 0.0]])
+        assert values == [[0, 0]]
+        assert scales == [1.0]
+
+
+class TestUpsertQuantization:
+    CHUNKS = [{"content": "Hello world", "chunk_index": 0, "token_count": 2}]
+
+    @staticmethod
+    def _service(metric: str) -> VectorStoreService:
+        service = VectorStoreService()
+        service._index = MagicMock()
+        service._index_metric = metric
+        service._embedding_service = MagicMock()
+        service._embedding_service.embed_texts.return_value = [[0.5, -0.25]]
+        return service
+
+    async def _upserted(self, service: VectorStoreService) -> dict:
+        await service.upsert_chunks(self.CHUNKS, uuid.uuid4(), uuid.uuid4())
+        return service.index.upsert.call_args.kwargs["vectors"][0]
+
+    @pytest.mark.asyncio
+    async def test_floats_by_default(self, monkeypatch):
+        monkeypatch.setattr(settings, "pinecone_int8_vectors", False)
+        vector = await self._upserted(self._service("cosine"))
+        assert vector["values"] == [0.5, -0.25]
+
+    @pytest.mark.asyncio
+    async def test_int8_on_cosine_index_when_enabled(self, monkeypatch):
+        monkeypatch.setattr(settings, "pinecone_int8_vectors", True)
+        vector = await self._upserted(self._service("cosine"))
+        assert vector["values"] == [127, -64]
+        assert "quant_scale" not in vector["metadata"]
+
+    @pytest.mark.asyncio
+    async def test_dotproduct_index_keeps_floats(self, monkeypatch):
+        monkeypatch.setattr(settings, "pinecone_int8_vectors", True)
+        monkeypatch.setattr(settings, "pinecone_hybrid", False)
+        vector = await self._upserted(self._service("dotproduct"))
+        assert vector["values"] == [0.5, -0.25]
+
+
+class TestSparseDense:
+    CHUNKS = [
+        {"content": "Hybrid search", "chunk_index": 0, "token_count": 2},
+        {"content": "the and of", "chunk_index": 1, "token_count": 3},
+    ]
+    SPARSE = [{"indices": [3, 7], "values": [0.4, 0.6]}, {"indices": [], "values": []}]
+
+    @staticmethod
+    def _service(metric: str) -> VectorStoreService:
+        service = VectorStoreService()
+        service._index = MagicMock()
+        service._index.query.return_value.matches = []
+        service._index_metric = metric
+        service._embedding_service = MagicMock()
+        service._embedding_service.embed_texts.return_value = [[0.5, -0.25], [0.1, 0.2]]
+        service._embedding_service.embed_sparse_documents.return_value = TestSparseDense.SPARSE
+        service._embedding_service.embed_query.return_value = [1.0, -0.5]
+        return service
+
+    @pytest.fixture(autouse=True)
+    def _hybrid(self, monkeypatch):
+        monkeypatch.setattr(settings, "pinecone_hybrid", True)
+        monkeypatch.setattr(settings, "pinecone_int8_vectors", False)
+        monkeypatch.setattr(settings, "hybrid_alpha", 0.75)
+
+    async def _upserted(self, service: VectorStoreService) -> list[dict]:
+        await service.upsert_chunks(self.CHUNKS, uuid.uuid4(), uuid.uuid4())
+        return service.index.upsert.call_args.kwargs["vectors"]
+
+    @pytest.mark.asyncio
+    async def test_upsert_attaches_sparse_values(self):
+        vectors = await self._upserted(self._service("dotproduct"))
+        assert vectors[0]["sparse_values"] == self.SPARSE[0]
+        # Pinecone rejects empty sparse vectors, so stop-word-only chunks go dense-only
+        assert "sparse_values" not in vectors[1]
+
+    @pytest.mark.asyncio
+    async def test_upsert_on_cosine_index_stays_dense(self):
+        service = self._service("cosine")
+        vectors = await self._upserted(service)
+        assert all("sparse_values" not in v for v in vectors)
+        service.embedding_service.embed_sparse_documents.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_search_scales_dense_and_sparse_legs(self):
+        service = self._service("dotproduct")
+        service.embedding_service.embed_sparse_query.return_value = {
+            "indices": [3], "values": [2.0]
+        }
+        await service.search("hybrid", uuid.uuid4(), hybrid=True)
+        kwargs = service.index.query.call_args.kwargs
+        assert kwargs["vector"] == [0.75, -0.375]
+        assert kwargs["sparse_vector"] == {"indices": [3], "values": [0.5]}
+
+    @pytest.mark.asyncio
+    async def test_search_skips_empty_sparse_query(self):
+        service = self._service("dotproduct")
+        service.embedding_service.embed_sparse_query.return_value = {"indices": [], "values": []}
+        await service.search("the", uuid.uuid4(), hybrid=True)
+        assert "sparse_vector" not in service.index.query.call_args.kwargs
+
+    @pytest.mark.asyncio
+    async def test_search_on_cosine_index_is_plain_dense(self):
+        service = self._service("cosine")
+        await service.search("hybrid", uuid.uuid4(), hybrid=True)
+        kwargs = service.index.query.call_args.kwargs
+        assert kwargs["vector"] == [1.0, -0.5]
+        assert "sparse_vector" not in kwargs
+        assert service.supports_sparse() is False
+
+    def test_supports_sparse_needs_the_setting(self, monkeypatch):
+        monkeypatch.setattr(settings, "pinecone_hybrid", False)
+        assert self._service("dotproduct").supports_sparse() is False
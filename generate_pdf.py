@@ -2,36 +2,57 @@
 """Generate a professional PDF presentation from the IntelliDoc Nexus project."""
 
 from fpdf import FPDF
-import re
+from fpdf.drawing import DeviceRGB
 
 # ──────────────────────────────────────────────────────────────
 # Colour palette
 # ──────────────────────────────────────────────────────────────
-NAVY      = (15, 23, 42)
-WHITE     = (255, 255, 255)
-BLUE      = (59, 130, 246)
-LIGHT_BG  = (248, 250, 252)
-GRAY      = (100, 116, 139)
-DARK_GRAY = (51, 65, 85)
-GREEN     = (34, 197, 94)
-ACCENT    = (99, 102, 241)  # indigo
+def _rgb(r, g, b):
+    """Palette entry as an fpdf2 device colour, converted once instead of per call."""
+    return DeviceRGB(r / 255, g / 255, b / 255)
+
+
+NAVY      = _rgb(15, 23, 42)
+WHITE     = _rgb(255, 255, 255)
+BLUE      = _rgb(59, 130, 246)
+LIGHT_BG  = _rgb(248, 250, 252)
+GRAY      = _rgb(100, 116, 139)
+DARK_GRAY = _rgb(51, 65, 85)
+GREEN     = _rgb(34, 197, 94)
+ACCENT    = _rgb(99, 102, 241)  # indigo
+SLATE     = _rgb(148, 163, 184)
+NOTE_BG   = _rgb(254, 249, 195)  # light yellow
+NOTE_TEXT = _rgb(120, 80, 0)
+PROBLEM   = _rgb(180, 60, 60)
+SOLUTION  = _rgb(30, 120, 60)
 
 class PresentationPDF(FPDF):
     current_slide = 0
     total_slides  = 0
     slide_title   = ""
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (family, style, size, text) -> width; badge labels and bold prefixes repeat
+        self._width_cache = {}
+
+    def get_string_width(self, s, normalized=False, markdown=False):
+        if normalized or markdown:
+            return super().get_string_width(s, normalized, markdown)
+        key = (self.font_family, self.font_style, self.font_size_pt, s)
+        width = self._width_cache.get(key)
+        if width is None:
+            width = self._width_cache[key] = super().get_string_width(s)
+        return width
+
     def header(self):
         if self.current_slide == 0:
             return
         self.set_font("Helvetica", "I", 8)
-        self.set_text_color(*GRAY)
+        self.set_text_color(GRAY)
         self.cell(0, 6, "IntelliDoc Nexus  |  Presentation Script", align="L")
         self.ln(2)
-        # accent line
-        self.set_draw_color(*BLUE)
-        self.set_line_width(0.4)
-        self.line(10, self.get_y(), self.w - 10, self.get_y())
+        self.accent_rule(10, self.w - 10, 0.4)
         self.ln(4)
 
     def footer(self):
@@ -39,44 +60,46 @@ class PresentationPDF(FPDF):
             return
         self.set_y(-15)
         self.set_font("Helvetica", "I", 8)
-        self.set_text_color(*GRAY)
+        self.set_text_color(GRAY)
         self.cell(0, 10, f"Page {self.page_no()}", align="C")
 
     # ── helpers ──────────────────────────────────────────────
+    def accent_rule(self, x1, x2, width, y=None):
+        """Horizontal blue rule at ``y`` (default: the cursor)."""
+        y = self.get_y() if y is None else y
+        self.set_draw_color(BLUE)
+        self.set_line_width(width)
+        self.line(x1, y, x2, y)
+
     def section_title(self, text, time_hint=""):
         self.set_font("Helvetica", "B", 18)
-        self.set_text_color(*NAVY)
+        self.set_text_color(NAVY)
         self.cell(0, 12, text, new_x="LMARGIN", new_y="NEXT")
         if time_hint:
             self.set_font("Helvetica", "I", 10)
-            self.set_text_color(*BLUE)
+            self.set_text_color(BLUE)
             self.cell(0, 6, time_hint, new_x="LMARGIN", new_y="NEXT")
-        # underline
-        self.set_draw_color(*BLUE)
-        self.set_line_width(0.6)
-        y = self.get_y() + 1
-        self.line(10, y, 80, y)
+        self.accent_rule(10, 80, 0.6, self.get_y() + 1)  # underline
         self.ln(6)
 
     def sub_heading(self, text):
         self.set_font("Helvetica", "B", 13)
-        self.set_text_color(*ACCENT)
+        self.set_text_color(ACCENT)
         self.ln(3)
         self.cell(0, 8, text, new_x="LMARGIN", new_y="NEXT")
         self.ln(1)
 
     def body(self, text):
         self.set_font("Helvetica", "", 10.5)
-        self.set_text_color(*DARK_GRAY)
+        self.set_text_color(DARK_GRAY)
         self.multi_cell(0, 5.5, text)
         self.ln(1)
 
     def speaker_note(self, text):
         """Yellow-highlighted speaker note block."""
-        self.set_fill_color(254, 249, 195)  # light yellow
+        self.set_fill_color(NOTE_BG)
         self.set_font("Helvetica", "I", 10)
-        self.set_text_color(120, 80, 0)
-        x = self.get_x()
+        self.set_text_color(NOTE_TEXT)
         w = self.w - 20
         self.set_x(10)
         self.multi_cell(w, 5.2, text, fill=True)
@@ -86,14 +109,12 @@ class PresentationPDF(FPDF):
         x_start = 14 + indent
         self.set_x(x_start)
         self.set_font("Helvetica", "", 10.5)
-        self.set_text_color(*DARK_GRAY)
+        self.set_text_color(DARK_GRAY)
         # bullet char (use dash since core fonts don't support unicode bullet)
         self.cell(5, 5.5, "-")
         if bold_prefix:
-            self.set_font("Helvetica", "B", 10.5)
-            self.cell(self.get_string_width(bold_prefix) + 1, 5.5, bold_prefix)
-            self.set_font("Helvetica", "", 10.5)
-            self.multi_cell(0, 5.5, text)
+            # One markdown pass lays out prefix and body, wrapping under the prefix
+            self.multi_cell(0, 5.5, f"**{bold_prefix}**{text}", markdown=True)
         else:
             self.multi_cell(0, 5.5, text)
         self.ln(0.5)
@@ -102,38 +123,55 @@ class PresentationPDF(FPDF):
         """Row of coloured tech badges."""
         self.ln(1)
         x = 12
-        for item in items:
-            w = self.get_string_width(item) + 8
+        self.set_font("Helvetica", "B", 8.5)
+        self.set_fill_color(BLUE)
+        self.set_text_color(WHITE)
+        widths = [self.get_string_width(item) + 8 for item in items]
+        for item, w in zip(items, widths):
             if x + w > self.w - 10:
+                # ln() only moves the cursor; font and colours carry over to the new row
                 self.ln(8)
                 x = 12
             self.set_xy(x, self.get_y())
-            self.set_fill_color(*BLUE)
-            self.set_text_color(*WHITE)
-            self.set_font("Helvetica", "B", 8.5)
             self.cell(w, 7, item, fill=True, align="C")
             x += w + 3
         self.ln(10)
 
-    def stat_box(self, label, value):
+    def stat_box(self, label, value, x=None, y=None):
+        x = self.get_x() if x is None else x
+        y = self.get_y() if y is None else y
+        self.stat_grid([(label, value)], x, y)
+        self.set_xy(x + 42 + 4, y)
+
+    def stat_grid(self, stats, x, y, cols=4, dx=48, dy=28):
+        """Stat boxes in rows of ``cols``, drawn shapes first, then values, then labels.
+
+        Grouping by kind selects each font and colour once for the whole grid instead
+        of switching back and forth for every box.
+        """
         w = 42
         h = 22
-        x = self.get_x()
-        y = self.get_y()
-        self.set_fill_color(*LIGHT_BG)
-        self.rect(x, y, w, h, "F")
-        self.set_draw_color(*BLUE)
+        boxes = [
+            (x + (i % cols) * dx, y + (i // cols) * dy, label, value)
+            for i, (label, value) in enumerate(stats)
+        ]
+        self.set_fill_color(LIGHT_BG)
+        for bx, by, _, _ in boxes:
+            self.rect(bx, by, w, h, "F")
+        self.set_draw_color(BLUE)
         self.set_line_width(0.4)
-        self.line(x, y, x, y + h)  # left accent
-        self.set_xy(x + 3, y + 2)
+        for bx, by, _, _ in boxes:
+            self.line(bx, by, bx, by + h)  # left accent
+        # Absolute text at the baselines the old 8 mm / 6 mm cells produced
+        text_dx = 3 + self.c_margin
         self.set_font("Helvetica", "B", 14)
-        self.set_text_color(*BLUE)
-        self.cell(w - 6, 8, str(value))
-        self.set_xy(x + 3, y + 11)
+        self.set_text_color(BLUE)
+        for bx, by, _, value in boxes:
+            self.text(bx + text_dx, by + 6 + 0.3 * self.font_size, str(value))
         self.set_font("Helvetica", "", 8)
-        self.set_text_color(*GRAY)
-        self.cell(w - 6, 6, label)
-        self.set_xy(x + w + 4, y)
+        self.set_text_color(GRAY)
+        for bx, by, label, _ in boxes:
+            self.text(bx + text_dx, by + 14 + 0.3 * self.font_size, label)
 
     def page_break_if_needed(self, space=40):
         if self.get_y() > self.h - space:
@@ -141,62 +179,10 @@ class PresentationPDF(FPDF):
 
 
 # ══════════════════════════════════════════════════════════════
-# BUILD THE PDF
+# SLIDE CONTENT
 # ══════════════════════════════════════════════════════════════
 
-pdf = PresentationPDF("P", "mm", "A4")
-pdf.set_auto_page_break(auto=True, margin=20)
-pdf.set_margins(10, 10, 10)
-
-# ── COVER PAGE ───────────────────────────────────────────────
-pdf.add_page()
-pdf.current_slide = 0
-
-# Navy background block
-pdf.set_fill_color(*NAVY)
-pdf.rect(0, 0, 210, 160, "F")
-
-# Title
-pdf.set_y(45)
-pdf.set_font("Helvetica", "B", 32)
-pdf.set_text_color(*WHITE)
-pdf.cell(0, 14, "IntelliDoc Nexus", align="C", new_x="LMARGIN", new_y="NEXT")
-
-pdf.set_font("Helvetica", "", 14)
-pdf.set_text_color(148, 163, 184)
-pdf.cell(0, 8, "Multi-Agent RAG-Powered Document Intelligence Platform", align="C", new_x="LMARGIN", new_y="NEXT")
-pdf.ln(6)
-
-# Accent line
-pdf.set_draw_color(*BLUE)
-pdf.set_line_width(1)
-pdf.line(60, pdf.get_y(), 150, pdf.get_y())
-pdf.ln(10)
-
-pdf.set_font("Helvetica", "", 12)
-pdf.set_text_color(*WHITE)
-pdf.cell(0, 7, "Technical Presentation & Live Demo", align="C", new_x="LMARGIN", new_y="NEXT")
-pdf.cell(0, 7, "30-Minute Walkthrough", align="C", new_x="LMARGIN", new_y="NEXT")
-
-# Below navy block
-pdf.set_y(170)
-pdf.set_font("Helvetica", "", 11)
-pdf.set_text_color(*DARK_GRAY)
-pdf.cell(0, 7, "Presented by: [YOUR NAME]", align="C", new_x="LMARGIN", new_y="NEXT")
-pdf.cell(0, 7, "[YOUR TITLE / ROLE]", align="C", new_x="LMARGIN", new_y="NEXT")
-pdf.cell(0, 7, "[DATE]", align="C", new_x="LMARGIN", new_y="NEXT")
-
-pdf.ln(12)
-pdf.set_font("Helvetica", "I", 9)
-pdf.set_text_color(*GRAY)
-pdf.cell(0, 6, "Built with: Python  |  React  |  FastAPI  |  PostgreSQL  |  Pinecone  |  Claude API  |  Docker", align="C")
-
-# ── SLIDE 1 : AGENDA ────────────────────────────────────────
-pdf.add_page()
-pdf.current_slide = 1
-pdf.section_title("Agenda", "30-Minute Presentation")
-
-agenda = [
+AGENDA = (
     ("1.", "Introduction & Project Overview", "2 min"),
     ("2.", "The Problem I Solved", "3 min"),
     ("3.", "System Architecture", "5 min"),
@@ -210,72 +196,9 @@ agenda = [
     ("11.", "Key Concepts Mastered", "3 min"),
     ("12.", "What Makes This Different", "2 min"),
     ("13.", "Future Roadmap & Q&A", "2 min"),
-]
-
-for num, title, time in agenda:
-    pdf.set_font("Helvetica", "B", 11)
-    pdf.set_text_color(*NAVY)
-    pdf.cell(8, 7, num)
-    pdf.set_font("Helvetica", "", 11)
-    pdf.set_text_color(*DARK_GRAY)
-    pdf.cell(120, 7, title)
-    pdf.set_font("Helvetica", "I", 10)
-    pdf.set_text_color(*BLUE)
-    pdf.cell(0, 7, time, new_x="LMARGIN", new_y="NEXT")
-
-# ── SLIDE 2 : INTRODUCTION ──────────────────────────────────
-pdf.add_page()
-pdf.current_slide = 2
-pdf.section_title("Introduction & Project Overview", "[2 minutes]")
-
-pdf.speaker_note(
-    "SAY: \"Good morning/afternoon everyone. My name is [YOUR NAME], and today I'm going to walk you "
-    "through IntelliDoc Nexus - a production-grade, multi-agent Retrieval-Augmented Generation platform "
-    "that I designed and built from the ground up.\""
-)
-
-pdf.body(
-    "IntelliDoc Nexus is a full-stack AI system that takes real documents - PDFs, Word files, "
-    "text files - processes them through a sophisticated machine learning pipeline, stores them "
-    "in a vector database, and uses five specialized AI agents working together to answer "
-    "questions about those documents with source citations and real-time streaming responses."
-)
-
-pdf.speaker_note(
-    "SAY: \"This is not a tutorial project. This is not a to-do app. This is a full-stack AI system "
-    "that demonstrates I can take a complex, ambiguous problem and turn it into a working, deployed, "
-    "production-ready system with proper architecture, testing, error handling, and DevOps.\""
-)
-
-pdf.sub_heading("At a Glance")
-pdf.ln(2)
-# Stats row
-y_stats = pdf.get_y()
-pdf.stat_box("Source Files", "99")
-pdf.stat_box("Lines of Code", "6,700+")
-pdf.stat_box("Automated Tests", "103")
-pdf.stat_box("Docker Services", "4")
-pdf.set_y(y_stats + 28)
-
-# ── SLIDE 3 : THE PROBLEM ───────────────────────────────────
-pdf.add_page()
-pdf.current_slide = 3
-pdf.section_title("The Problem I Solved", "[3 minutes]")
-
-pdf.speaker_note(
-    "SAY: \"Before I get into the technical details, let me explain the real-world problem this solves, "
-    "because understanding the problem is half the engineering.\""
-)
-
-pdf.body(
-    "Organizations today are drowning in documents. Research papers, legal contracts, technical "
-    "manuals, policy documents. The knowledge is there, but finding specific information across "
-    "hundreds of pages is painful."
 )
 
-pdf.sub_heading("Three Core Problems")
-
-problems = [
+PROBLEMS = (
     ("Problem 1: Information Retrieval. ",
      "Traditional keyword search fails when you're looking for concepts, not exact words. "
      "If I search for 'cost optimization' but my document says 'reducing expenses,' keyword search won't find it."),
@@ -285,30 +208,9 @@ problems = [
     ("Problem 3: Trustworthiness. ",
      "If I use ChatGPT to answer a question about my documents, it might hallucinate - give a confident "
      "answer that's completely made up. There's no way to verify where the information came from."),
-]
-for bold, text in problems:
-    pdf.bullet(text, bold_prefix=bold)
-
-pdf.ln(3)
-pdf.speaker_note(
-    "SAY: \"IntelliDoc Nexus solves all three. It uses semantic search to find relevant content by meaning. "
-    "It uses multiple AI agents to synthesize, cite, and verify the answer. And it provides source citations "
-    "so you can trace every claim back to the exact document and page number. This is the same architecture "
-    "that companies like Notion, Glean, and Perplexity AI use in production.\""
-)
-
-# ── SLIDE 4 : ARCHITECTURE ──────────────────────────────────
-pdf.add_page()
-pdf.current_slide = 4
-pdf.section_title("System Architecture", "[5 minutes]")
-
-pdf.speaker_note(
-    "SAY: \"Let me walk you through the system architecture. I want you to see that this isn't code thrown "
-    "together - it's a deliberately designed system with clear separation of concerns.\""
 )
 
-pdf.sub_heading("Four Containerized Services")
-services = [
+SERVICES = (
     ("React Frontend (Port 3000) - ",
      "Modern SPA with TypeScript, React 18, TailwindCSS, Zustand for state management."),
     ("FastAPI Backend (Port 8000) - ",
@@ -317,24 +219,16 @@ services = [
      "Primary data store for documents, chunks, sessions, users. Migrations via Alembic."),
     ("Redis 7 - ",
      "Message broker for Celery background tasks and caching layer."),
-]
-for bold, text in services:
-    pdf.bullet(text, bold_prefix=bold)
+)
 
-pdf.sub_heading("Backend Architecture Layers")
-layers = [
+LAYERS = (
     ("API Layer - ", "FastAPI routes, dependency injection, Pydantic v2 validation, proper HTTP status codes."),
     ("Service Layer - ", "Document processing, chunking, embedding, vector storage, BM25 search, RAG pipeline."),
     ("Agent Layer - ", "Five specialized AI agents: Retrieval, Synthesis, Citation, Reflection, Orchestrator."),
     ("Data Layer - ", "SQLAlchemy 2.0 async ORM with custom cross-database type compatibility."),
-]
-for bold, text in layers:
-    pdf.bullet(text, bold_prefix=bold)
-
-pdf.page_break_if_needed(70)
-pdf.sub_heading("Key Architectural Decisions")
+)
 
-decisions = [
+DECISIONS = (
     ("Async everywhere. ",
      "The entire backend uses asyncio, asyncpg, and async SQLAlchemy. Handles hundreds of concurrent "
      "requests without blocking."),
@@ -346,67 +240,24 @@ decisions = [
     ("Hybrid search with RRF. ",
      "Combines dense vector search with sparse BM25 search using Reciprocal Rank Fusion. "
      "Same technique used by Microsoft Bing and Elasticsearch 8."),
-]
-for bold, text in decisions:
-    pdf.bullet(text, bold_prefix=bold)
-
-# ── SLIDE 5 : TECH STACK ────────────────────────────────────
-pdf.add_page()
-pdf.current_slide = 5
-pdf.section_title("Tech Stack Deep Dive", "[3 minutes]")
-
-pdf.speaker_note(
-    "SAY: \"Let me break down the complete tech stack and why I chose each technology. "
-    "These weren't random choices - each one was selected for a specific reason.\""
 )
 
-pdf.sub_heading("Frontend")
-pdf.tech_badge(["React 18", "TypeScript", "TailwindCSS", "Zustand", "TanStack Query", "Vite", "Lucide Icons"])
-
-fe_items = [
+FE_ITEMS = (
     ("React 18 + TypeScript - ", "Type safety, component architecture, largest ecosystem."),
     ("Zustand over Redux - ", "Lightweight (1KB), zero boilerplate. Right tool for this app's state complexity."),
     ("TanStack React Query - ", "Automatic caching, background refetching. Industry standard for server state."),
     ("Vite - ", "10x faster HMR than webpack. Sub-second hot reload."),
-]
-for bold, text in fe_items:
-    pdf.bullet(text, bold_prefix=bold)
-
-pdf.sub_heading("Backend")
-pdf.tech_badge(["FastAPI", "SQLAlchemy 2.0", "Claude API", "Pinecone", "SentenceTransformers", "Pydantic v2", "Celery"])
+)
 
-be_items = [
+BE_ITEMS = (
     ("FastAPI - ", "Fastest Python framework. Async, auto-docs, dependency injection. Chosen over Django REST for streaming."),
     ("Claude API - ", "Sonnet for synthesis (quality), Haiku for agents (cost). Model-swappable design."),
     ("Pinecone Serverless - ", "Managed vector DB. Chose over ChromaDB/Qdrant for production-grade scaling."),
     ("SentenceTransformers - ", "all-MiniLM-L6-v2 model. 384-dim embeddings generated locally without API calls."),
     ("Pydantic v2 - ", "Rust-based rewrite. 5-17x faster than v1 for validation/serialization."),
-]
-for bold, text in be_items:
-    pdf.bullet(text, bold_prefix=bold)
-
-pdf.sub_heading("Infrastructure & Testing")
-pdf.tech_badge(["Docker Compose", "PostgreSQL 16", "Redis 7", "Alembic", "Prometheus", "Structlog", "Pytest", "Locust"])
-
-# ── SLIDE 6 : RAG PIPELINE ──────────────────────────────────
-pdf.add_page()
-pdf.current_slide = 6
-pdf.section_title("Deep Dive: The RAG Pipeline", "[5 minutes]")
-
-pdf.speaker_note(
-    "SAY: \"Now let me go deep on the most technically interesting part of this project: the RAG pipeline. "
-    "RAG stands for Retrieval-Augmented Generation, and it's the core innovation that makes this system useful.\""
-)
-
-pdf.body(
-    "Why RAG matters: LLMs are powerful but have two fundamental limitations - they hallucinate "
-    "(generate confident but wrong answers) and have a knowledge cutoff (don't know about your "
-    "private documents). RAG solves both by retrieving relevant context from actual documents "
-    "and passing it to the LLM along with the question."
 )
 
-pdf.sub_heading("Stage 1: Document Ingestion (7-Step Pipeline)")
-steps = [
+INGESTION_STEPS = (
     ("1. File Validation - ", "Type checking, size limits (100MB), extension mapping."),
     ("2. Duplicate Detection - ", "SHA-256 content hashing. Instant duplicate recognition."),
     ("3. Text Extraction - ", "pdfplumber for PDFs (with tables), python-docx for Word, UTF-8 for text. Built a sanitization layer for null bytes."),
@@ -414,55 +265,9 @@ steps = [
     ("5. Embedding Generation - ", "384-dim vectors via SentenceTransformers. Batched in groups of 32 for memory efficiency."),
     ("6. Vector Upsert - ", "Embeddings stored in Pinecone with metadata (doc ID, chunk index, page, content)."),
     ("7. BM25 Indexing - ", "Chunks tokenized and added to in-memory BM25 index for keyword search."),
-]
-for bold, text in steps:
-    pdf.bullet(text, bold_prefix=bold)
-
-pdf.page_break_if_needed(80)
-pdf.sub_heading("Stage 2: Hybrid Retrieval")
-pdf.body(
-    "When a user asks a question, two search strategies run in parallel:"
-)
-pdf.bullet("Dense search via Pinecone - Converts question to vector, finds semantically similar chunks. 'Cost reduction' matches 'reducing expenses.'", bold_prefix="")
-pdf.bullet("Sparse search via BM25 - Traditional keyword matching with TF-IDF. Catches exact term matches vector search might miss.", bold_prefix="")
-
-pdf.ln(2)
-pdf.body(
-    "Results are combined using Reciprocal Rank Fusion (k=60): "
-    "RRF_score(item) = sum(1/(k + rank)) for each list containing the item. "
-    "Items appearing in BOTH lists get higher scores. Research shows 5-15% retrieval accuracy improvement."
 )
 
-pdf.sub_heading("Stage 3: Context Enrichment")
-pdf.body(
-    "After retrieval, full chunk content is fetched from PostgreSQL (Pinecone metadata is size-limited). "
-    "Document names are resolved. Claude gets complete paragraphs, not truncated previews."
-)
-
-pdf.sub_heading("Stage 4: Generation with Citations")
-pdf.body(
-    "Enriched context is formatted with source markers [Source N] and streamed to Claude. "
-    "Response streams back via Server-Sent Events in real-time."
-)
-
-# ── SLIDE 7 : MULTI-AGENT ───────────────────────────────────
-pdf.add_page()
-pdf.current_slide = 7
-pdf.section_title("Deep Dive: Multi-Agent System", "[4 minutes]")
-
-pdf.speaker_note(
-    "SAY: \"On top of the standard RAG pipeline, I built a multi-agent system with five specialized agents. "
-    "This demonstrates understanding of agentic AI architecture - one of the hottest areas in AI right now.\""
-)
-
-pdf.body(
-    "Why multiple agents? A single LLM call can answer questions, but quality improves dramatically "
-    "when you decompose the task into specialized steps with quality control loops."
-)
-
-pdf.sub_heading("The Five Agents")
-
-agents = [
+AGENTS = (
     ("1. Retrieval Agent - ",
      "Analyzes the question and decides optimal retrieval strategy. Broad or focused? Higher top-k for complex questions? Uses Claude Haiku for speed."),
     ("2. Synthesis Agent - ",
@@ -473,27 +278,9 @@ agents = [
      "Evaluates complete response for quality. Does it answer the question? Clear? Well-structured? Below threshold? Sends back for revision. Self-improving loop."),
     ("5. Orchestrator Agent - ",
      "Coordinates the pipeline: Retrieval -> Synthesis -> Citation -> Reflection -> (optional revision). Manages state and traces."),
-]
-for bold, text in agents:
-    pdf.bullet(text, bold_prefix=bold)
-
-pdf.ln(3)
-pdf.speaker_note(
-    "SAY: \"The key insight is separation of concerns. Each agent has a single responsibility. "
-    "I implemented this using a state machine pattern - similar to LangGraph but built from scratch "
-    "to demonstrate I understand the underlying pattern, not just the library API.\""
 )
 
-# ── SLIDE 8 : LIVE DEMO ─────────────────────────────────────
-pdf.add_page()
-pdf.current_slide = 8
-pdf.section_title("Live Demo Script", "[5 minutes]")
-
-pdf.speaker_note(
-    "SAY: \"Now let me show you the system running live. Everything is running in Docker on my local machine.\""
-)
-
-demo_steps = [
+DEMO_STEPS = (
     ("Step 1: Show the UI. ",
      "Open http://localhost:3000. Point out sidebar (upload, documents, history), chat area, search tab, dark mode toggle."),
     ("Step 2: Upload a document. ",
@@ -508,13 +295,9 @@ demo_steps = [
      "Open http://localhost:8000/docs. Show 18 interactive endpoints. Explain OpenAPI/Swagger auto-generation."),
     ("Step 7: Docker Infrastructure. ",
      "Show terminal: docker compose ps. Four containers running with health checks."),
-]
-for bold, text in demo_steps:
-    pdf.bullet(text, bold_prefix=bold)
+)
 
-pdf.ln(3)
-pdf.sub_heading("Demo Checklist (verify before presenting)")
-checklist = [
+CHECKLIST = (
     "Docker containers all running: docker compose ps",
     "Backend health: curl http://localhost:8000/api/v1/health",
     "Frontend loads at http://localhost:3000",
@@ -522,26 +305,9 @@ checklist = [
     "Test a chat query to warm up the embedding model",
     "Have a sample PDF ready for live upload",
     "Browser in clean state (no console errors)",
-]
-for item in checklist:
-    pdf.set_x(14)
-    pdf.set_font("Helvetica", "", 10)
-    pdf.set_text_color(*DARK_GRAY)
-    pdf.cell(5, 5.5, "[ ]")  # checkbox
-    pdf.multi_cell(0, 5.5, " " + item)
-
-# ── SLIDE 9 : CHALLENGES ────────────────────────────────────
-pdf.add_page()
-pdf.current_slide = 9
-pdf.section_title("Engineering Challenges I Solved", "[5 minutes]")
-
-pdf.speaker_note(
-    "SAY: \"Building this system wasn't straightforward. I ran into real engineering problems "
-    "that required creative solutions. I think problem-solving ability is what separates a "
-    "junior developer from someone who can actually build production systems.\""
 )
 
-challenges = [
+CHALLENGES = (
     ("Challenge 1: Null Bytes in PDF Extraction",
      "Problem: Academic PDFs produce text with null bytes (\\x00) from math symbols. PostgreSQL TEXT columns reject null bytes, causing 500 errors on upload.",
      "Solution: Built a text sanitization layer that strips null bytes and control characters while preserving Unicode. Runs on all extracted text before storage."),
@@ -557,33 +323,9 @@ challenges = [
     ("Challenge 5: Frontend Streaming Error Recovery",
      "Problem: Original streaming used fire-and-forget fetch().then(). Errors silently swallowed. UI got permanently stuck in loading state.",
      "Solution: Rewrote as proper async/await with AbortController timeout, HTTP status checking, error propagation, and fallback to non-streaming mode."),
-]
-
-for title, problem, solution in challenges:
-    pdf.page_break_if_needed(45)
-    pdf.set_font("Helvetica", "B", 11)
-    pdf.set_text_color(*NAVY)
-    pdf.cell(0, 7, title, new_x="LMARGIN", new_y="NEXT")
-
-    pdf.set_font("Helvetica", "I", 10)
-    pdf.set_text_color(180, 60, 60)
-    pdf.set_x(10)
-    pdf.multi_cell(pdf.w - 20, 5, problem)
-
-    pdf.set_font("Helvetica", "", 10)
-    pdf.set_text_color(30, 120, 60)
-    pdf.set_x(10)
-    pdf.multi_cell(pdf.w - 20, 5, solution)
-    pdf.ln(3)
-
-# ── SLIDE 10 : TESTING ──────────────────────────────────────
-pdf.add_page()
-pdf.current_slide = 10
-pdf.section_title("Testing & Quality Assurance", "[2 minutes]")
-
-pdf.body("Production-ready code needs production-ready testing. 103 automated tests across multiple layers:")
+)
 
-test_categories = [
+TEST_CATEGORIES = (
     ("RAG Pipeline Tests - ",
      "Reciprocal Rank Fusion scoring, context building, message construction, source extraction. Edge cases: empty results, single source, score normalization."),
     ("Multi-Agent Tests - ",
@@ -594,23 +336,16 @@ test_categories = [
      "Session CRUD, health endpoint, metrics endpoint, end-to-end chat flow."),
     ("Load Tests (Locust) - ",
      "User behavior profiles simulating realistic usage: uploads, questions, searches under concurrent load."),
-]
-for bold, text in test_categories:
-    pdf.bullet(text, bold_prefix=bold)
-
-pdf.ln(3)
-pdf.body(
-    "All tests run in 7.7 seconds on SQLite backend - fast enough for CI/CD on every commit. "
-    "Alembic migrations provide version-controlled schema changes for production deployments."
 )
 
-# ── SLIDE 11 : METRICS ──────────────────────────────────────
-pdf.add_page()
-pdf.current_slide = 11
-pdf.section_title("Project Metrics & Achievements", "[2 minutes]")
+OVERVIEW_STATS = (
+    ("Source Files", "99"),
+    ("Lines of Code", "6,700+"),
+    ("Automated Tests", "103"),
+    ("Docker Services", "4"),
+)
 
-# Stats grid
-metrics = [
+METRICS = (
     ("Source Files", "99"),
     ("Lines of Code", "6,700+"),
     ("Python Modules", "49"),
@@ -619,22 +354,9 @@ metrics = [
     ("AI Agents", "5"),
     ("Automated Tests", "103"),
     ("Docker Services", "4"),
-]
-y_start = pdf.get_y() + 2
-col = 0
-for label, value in metrics:
-    x = 12 + (col * 48)
-    pdf.set_xy(x, y_start)
-    pdf.stat_box(label, value)
-    col += 1
-    if col >= 4:
-        col = 0
-        y_start += 28
-
-pdf.set_y(y_start + 30)
-
-pdf.sub_heading("Key Features Delivered")
-features = [
+)
+
+FEATURES = (
     "Hybrid search combining dense (vector) and sparse (BM25) retrieval with RRF",
     "Five-agent pipeline with self-improving reflection loop",
     "Real-time token streaming via Server-Sent Events",
@@ -642,72 +364,47 @@ features = [
     "Cross-database type compatibility layer (PostgreSQL + SQLite)",
     "Structured logging, Prometheus metrics, rate limiting, security headers",
     "Dark mode UI with responsive design and conversation export",
-]
-for f in features:
-    pdf.bullet(f)
-
-# ── SLIDE 12 : CONCEPTS ─────────────────────────────────────
-pdf.add_page()
-pdf.current_slide = 12
-pdf.section_title("Key Concepts I Mastered", "[3 minutes]")
+)
 
-concept_groups = [
-    ("1. Retrieval-Augmented Generation (RAG)", [
+CONCEPT_GROUPS = (
+    ("1. Retrieval-Augmented Generation (RAG)", (
         "Document ingestion pipelines with multi-format extraction",
         "Semantic chunking with heading detection and sentence-boundary overlap",
         "Embedding generation with SentenceTransformers",
         "Vector storage and similarity search with Pinecone",
         "Context enrichment and citation generation",
-    ]),
-    ("2. Agentic AI Architecture", [
+    )),
+    ("2. Agentic AI Architecture", (
         "Multi-agent systems with specialized roles",
         "State machine orchestration patterns",
         "Self-improving loops with reflection and revision",
         "Separation of concerns in AI pipeline design",
-    ]),
-    ("3. Full-Stack Engineering", [
+    )),
+    ("3. Full-Stack Engineering", (
         "Async Python: FastAPI, SQLAlchemy 2.0, asyncpg",
         "React 18 with TypeScript, Zustand, TanStack Query",
         "Real-time streaming with Server-Sent Events",
         "RESTful API design with validation and proper status codes",
-    ]),
-    ("4. Data Engineering", [
+    )),
+    ("4. Data Engineering", (
         "Hybrid search: dense + sparse retrieval with RRF",
         "Vector database management with Pinecone",
         "PostgreSQL async ORM with cross-database compatibility",
-    ]),
-    ("5. DevOps & Production Readiness", [
+    )),
+    ("5. DevOps & Production Readiness", (
         "Docker Compose multi-service orchestration",
         "Database migrations, health checks, rate limiting",
         "Prometheus metrics and structured logging",
         "Comprehensive automated testing (103 tests)",
-    ]),
-    ("6. Problem Solving", [
+    )),
+    ("6. Problem Solving", (
         "Debugging production issues: null bytes, streaming consistency, memory management",
         "Designing for resilience: timeouts, error recovery, graceful degradation",
         "Performance optimization: lazy loading, batch processing, caching",
-    ]),
-]
-
-for group_title, items in concept_groups:
-    pdf.page_break_if_needed(30)
-    pdf.set_font("Helvetica", "B", 11)
-    pdf.set_text_color(*ACCENT)
-    pdf.cell(0, 7, group_title, new_x="LMARGIN", new_y="NEXT")
-    for item in items:
-        pdf.bullet(item, indent=4)
-    pdf.ln(1)
-
-# ── SLIDE 13 : DIFFERENTIATOR ───────────────────────────────
-pdf.add_page()
-pdf.current_slide = 13
-pdf.section_title("What Makes This Different", "[2 minutes]")
-
-pdf.speaker_note(
-    "SAY: \"I want to address why this project stands out compared to other portfolio projects you might see.\""
+    )),
 )
 
-diffs = [
+DIFFS = (
     ("Production-grade, not proof-of-concept. ",
      "Error handling, input validation, rate limiting, security headers, structured logging, "
      "metrics, health checks, automated tests. Most portfolio RAG projects skip all of this."),
@@ -720,25 +417,9 @@ diffs = [
     ("Theory understood, not just applied. ",
      "I can explain why RRF works, why hybrid search outperforms single-strategy, why multi-agent "
      "produces better results than single-prompt, and why each architectural decision was made."),
-]
-for bold, text in diffs:
-    pdf.bullet(text, bold_prefix=bold)
-    pdf.ln(1)
-
-pdf.ln(4)
-pdf.set_font("Helvetica", "B", 12)
-pdf.set_text_color(*NAVY)
-pdf.set_x(10)
-pdf.multi_cell(pdf.w - 20, 7,
-    "This project demonstrates that I can take an ambiguous, complex problem and deliver "
-    "a working, well-architected, production-ready solution.", align="C")
-
-# ── SLIDE 14 : FUTURE + Q&A ─────────────────────────────────
-pdf.add_page()
-pdf.current_slide = 14
-pdf.section_title("Future Roadmap", "[1 minute]")
-
-future = [
+)
+
+FUTURE = (
     "Kubernetes deployment with horizontal pod autoscaling",
     "OAuth 2.0 / SSO authentication",
     "WebSocket support for bi-directional real-time communication",
@@ -746,14 +427,9 @@ future = [
     "Fine-tuned embedding model on domain-specific data",
     "CI/CD pipeline with GitHub Actions",
     "Response caching and adaptive model selection for cost optimization",
-]
-for f in future:
-    pdf.bullet(f)
-
-pdf.ln(6)
-pdf.section_title("Q&A Preparation", "")
+)
 
-qa = [
+QA = (
     ("Q: Why Claude over GPT-4?",
      "Excellent citation following, generous context window, clean streaming API. Designed with abstraction layer - swapping models requires changing one file."),
     ("Q: How would you scale this?",
@@ -764,61 +440,435 @@ qa = [
      "Built from scratch to demonstrate understanding of underlying patterns. Full control, easier debugging. Would evaluate LangChain based on team needs."),
     ("Q: Latency?",
      "Non-streaming: 3-5s. Streaming first token: <2s. Upload+embed: 1-2s small, 15-20s large PDFs. Bottleneck is Claude API, not infrastructure."),
-]
-for question, answer in qa:
-    pdf.page_break_if_needed(25)
-    pdf.set_font("Helvetica", "B", 10)
-    pdf.set_text_color(*NAVY)
-    pdf.set_x(10)
-    pdf.multi_cell(pdf.w - 20, 5, question)
-    pdf.set_font("Helvetica", "", 10)
-    pdf.set_text_color(*DARK_GRAY)
-    pdf.set_x(10)
-    pdf.multi_cell(pdf.w - 20, 5, answer)
+)
+
+
+# ══════════════════════════════════════════════════════════════
+# BUILD THE PDF
+# ══════════════════════════════════════════════════════════════
+
+def main():
+    pdf = PresentationPDF("P", "mm", "A4")
+    pdf.set_auto_page_break(auto=True, margin=20)
+    pdf.set_margins(10, 10, 10)
+
+    # ── COVER PAGE ───────────────────────────────────────────────
+    pdf.add_page()
+    pdf.current_slide = 0
+
+    # Navy background block
+    pdf.set_fill_color(NAVY)
+    pdf.rect(0, 0, 210, 160, "F")
+
+    # Title
+    pdf.set_y(45)
+    pdf.set_font("Helvetica", "B", 32)
+    pdf.set_text_color(WHITE)
+    pdf.cell(0, 14, "IntelliDoc Nexus", align="C", new_x="LMARGIN", new_y="NEXT")
+
+    pdf.set_font("Helvetica", "", 14)
+    pdf.set_text_color(SLATE)
+    pdf.cell(0, 8, "Multi-Agent RAG-Powered Document Intelligence Platform", align="C", new_x="LMARGIN", new_y="NEXT")
+    pdf.ln(6)
+
+    pdf.accent_rule(60, 150, 1)
+    pdf.ln(10)
+
+    pdf.set_font("Helvetica", "", 12)
+    pdf.set_text_color(WHITE)
+    pdf.cell(0, 7, "Technical Presentation & Live Demo", align="C", new_x="LMARGIN", new_y="NEXT")
+    pdf.cell(0, 7, "30-Minute Walkthrough", align="C", new_x="LMARGIN", new_y="NEXT")
+
+    # Below navy block
+    pdf.set_y(170)
+    pdf.set_font("Helvetica", "", 11)
+    pdf.set_text_color(DARK_GRAY)
+    pdf.cell(0, 7, "Presented by: [YOUR NAME]", align="C", new_x="LMARGIN", new_y="NEXT")
+    pdf.cell(0, 7, "[YOUR TITLE / ROLE]", align="C", new_x="LMARGIN", new_y="NEXT")
+    pdf.cell(0, 7, "[DATE]", align="C", new_x="LMARGIN", new_y="NEXT")
+
+    pdf.ln(12)
+    pdf.set_font("Helvetica", "I", 9)
+    pdf.set_text_color(GRAY)
+    pdf.cell(0, 6, "Built with: Python  |  React  |  FastAPI  |  PostgreSQL  |  Pinecone  |  Claude API  |  Docker", align="C")
+
+    # ── SLIDE 1 : AGENDA ────────────────────────────────────────
+    pdf.add_page()
+    pdf.current_slide = 1
+    pdf.section_title("Agenda", "30-Minute Presentation")
+
+    for num, title, time in AGENDA:
+        pdf.set_font("Helvetica", "B", 11)
+        pdf.set_text_color(NAVY)
+        pdf.cell(8, 7, num)
+        pdf.set_font("Helvetica", "", 11)
+        pdf.set_text_color(DARK_GRAY)
+        pdf.cell(120, 7, title)
+        pdf.set_font("Helvetica", "I", 10)
+        pdf.set_text_color(BLUE)
+        pdf.cell(0, 7, time, new_x="LMARGIN", new_y="NEXT")
+
+    # ── SLIDE 2 : INTRODUCTION ──────────────────────────────────
+    pdf.add_page()
+    pdf.current_slide = 2
+    pdf.section_title("Introduction & Project Overview", "[2 minutes]")
+
+    pdf.speaker_note(
+        "SAY: \"Good morning/afternoon everyone. My name is [YOUR NAME], and today I'm going to walk you "
+        "through IntelliDoc Nexus - a production-grade, multi-agent Retrieval-Augmented Generation platform "
+        "that I designed and built from the ground up.\""
+    )
+
+    pdf.body(
+        "IntelliDoc Nexus is a full-stack AI system that takes real documents - PDFs, Word files, "
+        "text files - processes them through a sophisticated machine learning pipeline, stores them "
+        "in a vector database, and uses five specialized AI agents working together to answer "
+        "questions about those documents with source citations and real-time streaming responses."
+    )
+
+    pdf.speaker_note(
+        "SAY: \"This is not a tutorial project. This is not a to-do app. This is a full-stack AI system "
+        "that demonstrates I can take a complex, ambiguous problem and turn it into a working, deployed, "
+        "production-ready system with proper architecture, testing, error handling, and DevOps.\""
+    )
+
+    pdf.sub_heading("At a Glance")
     pdf.ln(2)
+    # Stats row
+    y_stats = pdf.get_y()
+    pdf.stat_grid(OVERVIEW_STATS, pdf.get_x(), y_stats, dx=46)
+    pdf.set_y(y_stats + 28)
 
-# ── CLOSING PAGE ─────────────────────────────────────────────
-pdf.add_page()
-pdf.current_slide = 15
+    # ── SLIDE 3 : THE PROBLEM ───────────────────────────────────
+    pdf.add_page()
+    pdf.current_slide = 3
+    pdf.section_title("The Problem I Solved", "[3 minutes]")
 
-# Navy block
-pdf.set_fill_color(*NAVY)
-pdf.rect(0, 0, 210, 297, "F")
+    pdf.speaker_note(
+        "SAY: \"Before I get into the technical details, let me explain the real-world problem this solves, "
+        "because understanding the problem is half the engineering.\""
+    )
 
-pdf.set_y(80)
-pdf.set_font("Helvetica", "B", 28)
-pdf.set_text_color(*WHITE)
-pdf.cell(0, 12, "Thank You", align="C", new_x="LMARGIN", new_y="NEXT")
+    pdf.body(
+        "Organizations today are drowning in documents. Research papers, legal contracts, technical "
+        "manuals, policy documents. The knowledge is there, but finding specific information across "
+        "hundreds of pages is painful."
+    )
 
-pdf.ln(4)
-pdf.set_draw_color(*BLUE)
-pdf.set_line_width(1)
-pdf.line(70, pdf.get_y(), 140, pdf.get_y())
-pdf.ln(8)
+    pdf.sub_heading("Three Core Problems")
 
-pdf.set_font("Helvetica", "", 14)
-pdf.set_text_color(148, 163, 184)
-pdf.cell(0, 8, "IntelliDoc Nexus", align="C", new_x="LMARGIN", new_y="NEXT")
-pdf.cell(0, 8, "Multi-Agent RAG-Powered Document Intelligence", align="C", new_x="LMARGIN", new_y="NEXT")
-pdf.ln(15)
+    for bold, text in PROBLEMS:
+        pdf.bullet(text, bold_prefix=bold)
 
-pdf.set_font("Helvetica", "", 12)
-pdf.set_text_color(*WHITE)
-pdf.cell(0, 8, "[YOUR NAME]", align="C", new_x="LMARGIN", new_y="NEXT")
-pdf.cell(0, 8, "[YOUR EMAIL]", align="C", new_x="LMARGIN", new_y="NEXT")
-pdf.cell(0, 8, "[YOUR LINKEDIN / GITHUB]", align="C", new_x="LMARGIN", new_y="NEXT")
+    pdf.ln(3)
+    pdf.speaker_note(
+        "SAY: \"IntelliDoc Nexus solves all three. It uses semantic search to find relevant content by meaning. "
+        "It uses multiple AI agents to synthesize, cite, and verify the answer. And it provides source citations "
+        "so you can trace every claim back to the exact document and page number. This is the same architecture "
+        "that companies like Notion, Glean, and Perplexity AI use in production.\""
+    )
+
+    # ── SLIDE 4 : ARCHITECTURE ──────────────────────────────────
+    pdf.add_page()
+    pdf.current_slide = 4
+    pdf.section_title("System Architecture", "[5 minutes]")
+
+    pdf.speaker_note(
+        "SAY: \"Let me walk you through the system architecture. I want you to see that this isn't code thrown "
+        "together - it's a deliberately designed system with clear separation of concerns.\""
+    )
+
+    pdf.sub_heading("Four Containerized Services")
+    for bold, text in SERVICES:
+        pdf.bullet(text, bold_prefix=bold)
+
+    pdf.sub_heading("Backend Architecture Layers")
+    for bold, text in LAYERS:
+        pdf.bullet(text, bold_prefix=bold)
+
+    pdf.page_break_if_needed(70)
+    pdf.sub_heading("Key Architectural Decisions")
+
+    for bold, text in DECISIONS:
+        pdf.bullet(text, bold_prefix=bold)
+
+    # ── SLIDE 5 : TECH STACK ────────────────────────────────────
+    pdf.add_page()
+    pdf.current_slide = 5
+    pdf.section_title("Tech Stack Deep Dive", "[3 minutes]")
+
+    pdf.speaker_note(
+        "SAY: \"Let me break down the complete tech stack and why I chose each technology. "
+        "These weren't random choices - each one was selected for a specific reason.\""
+    )
+
+    pdf.sub_heading("Frontend")
+    pdf.tech_badge(["React 18", "TypeScript", "TailwindCSS", "Zustand", "TanStack Query", "Vite", "Lucide Icons"])
+
+    for bold, text in FE_ITEMS:
+        pdf.bullet(text, bold_prefix=bold)
+
+    pdf.sub_heading("Backend")
+    pdf.tech_badge(["FastAPI", "SQLAlchemy 2.0", "Claude API", "Pinecone", "SentenceTransformers", "Pydantic v2", "Celery"])
+
+    for bold, text in BE_ITEMS:
+        pdf.bullet(text, bold_prefix=bold)
+
+    pdf.sub_heading("Infrastructure & Testing")
+    pdf.tech_badge(["Docker Compose", "PostgreSQL 16", "Redis 7", "Alembic", "Prometheus", "Structlog", "Pytest", "Locust"])
+
+    # ── SLIDE 6 : RAG PIPELINE ──────────────────────────────────
+    pdf.add_page()
+    pdf.current_slide = 6
+    pdf.section_title("Deep Dive: The RAG Pipeline", "[5 minutes]")
+
+    pdf.speaker_note(
+        "SAY: \"Now let me go deep on the most technically interesting part of this project: the RAG pipeline. "
+        "RAG stands for Retrieval-Augmented Generation, and it's the core innovation that makes this system useful.\""
+    )
+
+    pdf.body(
+        "Why RAG matters: LLMs are powerful but have two fundamental limitations - they hallucinate "
+        "(generate confident but wrong answers) and have a knowledge cutoff (don't know about your "
+        "private documents). RAG solves both by retrieving relevant context from actual documents "
+        "and passing it to the LLM along with the question."
+    )
+
+    pdf.sub_heading("Stage 1: Document Ingestion (7-Step Pipeline)")
+    for bold, text in INGESTION_STEPS:
+        pdf.bullet(text, bold_prefix=bold)
+
+    pdf.page_break_if_needed(80)
+    pdf.sub_heading("Stage 2: Hybrid Retrieval")
+    pdf.body(
+        "When a user asks a question, two search strategies run in parallel:"
+    )
+    pdf.bullet("Dense search via Pinecone - Converts question to vector, finds semantically similar chunks. 'Cost reduction' matches 'reducing expenses.'", bold_prefix="")
+    pdf.bullet("Sparse search via BM25 - Traditional keyword matching with TF-IDF. Catches exact term matches vector search might miss.", bold_prefix="")
 
-pdf.ln(20)
-pdf.set_font("Helvetica", "I", 11)
-pdf.set_text_color(148, 163, 184)
-pdf.cell(0, 8, "\"I'm happy to answer any questions -", align="C", new_x="LMARGIN", new_y="NEXT")
-pdf.cell(0, 8, "and I can dive into any part of the codebase live right now.\"", align="C", new_x="LMARGIN", new_y="NEXT")
+    pdf.ln(2)
+    pdf.body(
+        "Results are combined using Reciprocal Rank Fusion (k=60): "
+        "RRF_score(item) = sum(1/(k + rank)) for each list containing the item. "
+        "Items appearing in BOTH lists get higher scores. Research shows 5-15% retrieval accuracy improvement."
+    )
+
+    pdf.sub_heading("Stage 3: Context Enrichment")
+    pdf.body(
+        "After retrieval, full chunk content is fetched from PostgreSQL (Pinecone metadata is size-limited). "
+        "Document names are resolved. Claude gets complete paragraphs, not truncated previews."
+    )
+
+    pdf.sub_heading("Stage 4: Generation with Citations")
+    pdf.body(
+        "Enriched context is formatted with source markers [Source N] and streamed to Claude. "
+        "Response streams back via Server-Sent Events in real-time."
+    )
+
+    # ── SLIDE 7 : MULTI-AGENT ───────────────────────────────────
+    pdf.add_page()
+    pdf.current_slide = 7
+    pdf.section_title("Deep Dive: Multi-Agent System", "[4 minutes]")
+
+    pdf.speaker_note(
+        "SAY: \"On top of the standard RAG pipeline, I built a multi-agent system with five specialized agents. "
+        "This demonstrates understanding of agentic AI architecture - one of the hottest areas in AI right now.\""
+    )
+
+    pdf.body(
+        "Why multiple agents? A single LLM call can answer questions, but quality improves dramatically "
+        "when you decompose the task into specialized steps with quality control loops."
+    )
+
+    pdf.sub_heading("The Five Agents")
+
+    for bold, text in AGENTS:
+        pdf.bullet(text, bold_prefix=bold)
 
+    pdf.ln(3)
+    pdf.speaker_note(
+        "SAY: \"The key insight is separation of concerns. Each agent has a single responsibility. "
+        "I implemented this using a state machine pattern - similar to LangGraph but built from scratch "
+        "to demonstrate I understand the underlying pattern, not just the library API.\""
+    )
 
-# ══════════════════════════════════════════════════════════════
-# SAVE
-# ══════════════════════════════════════════════════════════════
-output_path = "/Users/nagavenkatasaichennu/Desktop/project-1/intellidoc-nexus/IntelliDoc_Nexus_Presentation.pdf"
-pdf.output(output_path)
-print(f"PDF generated: {output_path}")
-print(f"Pages: {pdf.page_no()}")
+    # ── SLIDE 8 : LIVE DEMO ─────────────────────────────────────
+    pdf.add_page()
+    pdf.current_slide = 8
+    pdf.section_title("Live Demo Script", "[5 minutes]")
+
+    pdf.speaker_note(
+        "SAY: \"Now let me show you the system running live. Everything is running in Docker on my local machine.\""
+    )
+
+    for bold, text in DEMO_STEPS:
+        pdf.bullet(text, bold_prefix=bold)
+
+    pdf.ln(3)
+    pdf.sub_heading("Demo Checklist (verify before presenting)")
+    for item in CHECKLIST:
+        pdf.set_x(14)
+        pdf.set_font("Helvetica", "", 10)
+        pdf.set_text_color(DARK_GRAY)
+        pdf.cell(5, 5.5, "[ ]")  # checkbox
+        pdf.multi_cell(0, 5.5, " " + item)
+
+    # ── SLIDE 9 : CHALLENGES ────────────────────────────────────
+    pdf.add_page()
+    pdf.current_slide = 9
+    pdf.section_title("Engineering Challenges I Solved", "[5 minutes]")
+
+    pdf.speaker_note(
+        "SAY: \"Building this system wasn't straightforward. I ran into real engineering problems "
+        "that required creative solutions. I think problem-solving ability is what separates a "
+        "junior developer from someone who can actually build production systems.\""
+    )
+
+    for title, problem, solution in CHALLENGES:
+        pdf.page_break_if_needed(45)
+        pdf.set_font("Helvetica", "B", 11)
+        pdf.set_text_color(NAVY)
+        pdf.cell(0, 7, title, new_x="LMARGIN", new_y="NEXT")
+
+        pdf.set_font("Helvetica", "I", 10)
+        pdf.set_text_color(PROBLEM)
+        pdf.multi_cell(pdf.w - 20, 5, problem, new_x="LMARGIN", new_y="NEXT")
+
+        pdf.set_font("Helvetica", "", 10)
+        pdf.set_text_color(SOLUTION)
+        pdf.multi_cell(pdf.w - 20, 5, solution)
+        pdf.ln(3)
+
+    # ── SLIDE 10 : TESTING ──────────────────────────────────────
+    pdf.add_page()
+    pdf.current_slide = 10
+    pdf.section_title("Testing & Quality Assurance", "[2 minutes]")
+
+    pdf.body("Production-ready code needs production-ready testing. 103 automated tests across multiple layers:")
+
+    for bold, text in TEST_CATEGORIES:
+        pdf.bullet(text, bold_prefix=bold)
+
+    pdf.ln(3)
+    pdf.body(
+        "All tests run in 7.7 seconds on SQLite backend - fast enough for CI/CD on every commit. "
+        "Alembic migrations provide version-controlled schema changes for production deployments."
+    )
+
+    # ── SLIDE 11 : METRICS ──────────────────────────────────────
+    pdf.add_page()
+    pdf.current_slide = 11
+    pdf.section_title("Project Metrics & Achievements", "[2 minutes]")
+
+    # Stats grid
+    y_start = pdf.get_y() + 2
+    pdf.stat_grid(METRICS, 12, y_start)
+    pdf.set_y(y_start + 28 * (len(METRICS) // 4) + 30)
+
+    pdf.sub_heading("Key Features Delivered")
+    for f in FEATURES:
+        pdf.bullet(f)
+
+    # ── SLIDE 12 : CONCEPTS ─────────────────────────────────────
+    pdf.add_page()
+    pdf.current_slide = 12
+    pdf.section_title("Key Concepts I Mastered", "[3 minutes]")
+
+    for group_title, items in CONCEPT_GROUPS:
+        pdf.page_break_if_needed(30)
+        pdf.set_font("Helvetica", "B", 11)
+        pdf.set_text_color(ACCENT)
+        pdf.cell(0, 7, group_title, new_x="LMARGIN", new_y="NEXT")
+        for item in items:
+            pdf.bullet(item, indent=4)
+        pdf.ln(1)
+
+    # ── SLIDE 13 : DIFFERENTIATOR ───────────────────────────────
+    pdf.add_page()
+    pdf.current_slide = 13
+    pdf.section_title("What Makes This Different", "[2 minutes]")
+
+    pdf.speaker_note(
+        "SAY: \"I want to address why this project stands out compared to other portfolio projects you might see.\""
+    )
+
+    for bold, text in DIFFS:
+        pdf.bullet(text, bold_prefix=bold)
+        pdf.ln(1)
+
+    pdf.ln(4)
+    pdf.set_font("Helvetica", "B", 12)
+    pdf.set_text_color(NAVY)
+    pdf.multi_cell(pdf.w - 20, 7,
+        "This project demonstrates that I can take an ambiguous, complex problem and deliver "
+        "a working, well-architected, production-ready solution.", align="C")
+
+    # ── SLIDE 14 : FUTURE + Q&A ─────────────────────────────────
+    pdf.add_page()
+    pdf.current_slide = 14
+    pdf.section_title("Future Roadmap", "[1 minute]")
+
+    for f in FUTURE:
+        pdf.bullet(f)
+
+    pdf.ln(6)
+    pdf.section_title("Q&A Preparation", "")
+
+    for question, answer in QA:
+        pdf.page_break_if_needed(25)
+        pdf.set_font("Helvetica", "B", 10)
+        pdf.set_text_color(NAVY)
+        pdf.multi_cell(pdf.w - 20, 5, question, new_x="LMARGIN", new_y="NEXT")
+        pdf.set_font("Helvetica", "", 10)
+        pdf.set_text_color(DARK_GRAY)
+        pdf.multi_cell(pdf.w - 20, 5, answer)
+        pdf.ln(2)
+
+    # ── CLOSING PAGE ─────────────────────────────────────────────
+    pdf.add_page()
+    pdf.current_slide = 15
+
+    # Navy block
+    pdf.set_fill_color(NAVY)
+    pdf.rect(0, 0, 210, 297, "F")
+
+    pdf.set_y(80)
+    pdf.set_font("Helvetica", "B", 28)
+    pdf.set_text_color(WHITE)
+    pdf.cell(0, 12, "Thank You", align="C", new_x="LMARGIN", new_y="NEXT")
+
+    pdf.ln(4)
+    pdf.accent_rule(70, 140, 1)
+    pdf.ln(8)
+
+    pdf.set_font("Helvetica", "", 14)
+    pdf.set_text_color(SLATE)
+    pdf.multi_cell(0, 8, "IntelliDoc Nexus\nMulti-Agent RAG-Powered Document Intelligence",
+                   align="C", new_x="LMARGIN", new_y="NEXT")
+    pdf.ln(15)
+
+    pdf.set_font("Helvetica", "", 12)
+    pdf.set_text_color(WHITE)
+    pdf.multi_cell(0, 8, "[YOUR NAME]\n[YOUR EMAIL]\n[YOUR LINKEDIN / GITHUB]",
+                   align="C", new_x="LMARGIN", new_y="NEXT")
+
+    pdf.ln(20)
+    pdf.set_font("Helvetica", "I", 11)
+    pdf.set_text_color(SLATE)
+    pdf.multi_cell(0, 8, "\"I'm happy to answer any questions -\n"
+                   "and I can dive into any part of the codebase live right now.\"",
+                   align="C", new_x="LMARGIN", new_y="NEXT")
+
+
+    # ══════════════════════════════════════════════════════════════
+    # SAVE
+    # ══════════════════════════════════════════════════════════════
+    output_path = "/Users/nagavenkatasaichennu/Desktop/project-1/intellidoc-nexus/IntelliDoc_Nexus_Presentation.pdf"
+    page_count = pdf.page_no()
+    pdf.output(output_path)
+    print(f"PDF generated: {output_path}")
+    print(f"Pages: {page_count}")
+
+
+if __name__ == "__main__":
+    main()